@@ -0,0 +1 @@
+"""Benchmarks of the plugin on synthetic documentation trees, see `python -m benchmarks.run --help`"""
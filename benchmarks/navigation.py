@@ -0,0 +1,181 @@
+"""In-memory benchmarks of the navigation processing, without MkDocs builds or Markdown rendering
+
+`Page`/`Section` trees are constructed directly and the metadata gathering is replaced by a precomputed mapping, like
+`NavigationMetaMock` does in the navigation tests. The processing phases are timed on trees of growing size and the
+scaling exponent between consecutive sizes is reported: about 1 is linear, noticeably more is superlinear.
+
+Example:
+
+    python -m benchmarks.navigation --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import collections
+import contextlib
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from unittest import mock
+
+from mkdocs.structure.files import File
+from mkdocs.structure.nav import Section
+from mkdocs.structure.pages import Page
+
+from mkdocs_awesome_pages_plugin.meta import Meta, MetaNavItem
+from mkdocs_awesome_pages_plugin.navigation import AwesomeNavigation, get_by_type
+from mkdocs_awesome_pages_plugin.options import Options
+from mkdocs_awesome_pages_plugin.profiling import profiler
+
+PHASES = (
+    "AwesomeNavigation._process_children",
+    "AwesomeNavigation._order",
+    "AwesomeNavigation._nav",
+    "AwesomeNavigation.to_mkdocs",
+    "get_by_type",
+)
+DOCS_DIR = os.path.abspath("docs")
+
+
+class StaticNavigationMeta:
+    """Stands in for `NavigationMeta`, serving metadata created along with the tree"""
+
+    def __init__(self, root: Meta, sections: Dict[Section, Meta], paths: Dict[int, Tuple[str, str]]):
+        self.root = root
+        self.sections = sections
+        self.paths = paths
+        self.signatures = {}
+
+    def __call__(self, *args, **kwargs) -> "StaticNavigationMeta":
+        return self
+
+
+def build_tree(nodes: int, pages: int, fanout: int, meta_ratio: float) -> Tuple[List[Section], StaticNavigationMeta]:
+    """Builds a tree of `nodes` pages and sections, breadth first
+
+    Each section contains `pages` pages and `fanout` subsections. Every other section is ordered descending and a
+    `meta_ratio` share of them has a nav listing one page explicitly, followed by a glob rest entry and `...`.
+    """
+    root: List[Section] = []
+    sections: Dict[Section, Meta] = {}
+    paths: Dict[int, Tuple[str, str]] = {}
+    queue = collections.deque([(root, "")])
+    count = 0
+    index = 0
+
+    while queue and count < nodes:
+        children, directory = queue.popleft()
+        for page in range(pages):
+            if count >= nodes:
+                break
+            path = os.path.join(directory, "page-{}.md".format(page))
+            item = Page(None, File(path, DOCS_DIR, "", False), {})
+            paths[id(item)] = (item.file.abs_src_path, os.path.basename(path))
+            children.append(item)
+            count += 1
+        for section in range(fanout):
+            if count >= nodes:
+                break
+            path = os.path.join(directory, "section-{}".format(section))
+            item = Section("Section {}".format(section), [])
+            sections[item] = _meta(os.path.join(DOCS_DIR, path), index, meta_ratio, pages)
+            paths[id(item)] = (os.path.join(DOCS_DIR, path), os.path.basename(path))
+            children.append(item)
+            queue.append((item.children, path))
+            count += 1
+            index += 1
+
+    return root, StaticNavigationMeta(_meta(DOCS_DIR, 0, meta_ratio, pages), sections, paths)
+
+
+def _meta(directory: str, index: int, meta_ratio: float, pages: int) -> Meta:
+    path = os.path.join(directory, ".pages")
+    nav = None
+    # spreads the sections with a nav evenly instead of picking them at random, to keep the runs comparable
+    if math.floor((index + 1) * meta_ratio) > math.floor(index * meta_ratio):
+        entries = ["page-{}.md".format(pages - 1), "... | glob=page-1*", "..."]
+        nav = [MetaNavItem.from_yaml(entry, path) for entry in entries]
+    return Meta(path=path, nav=nav, order=Meta.ORDER_DESC if index % 2 else None)
+
+
+def measure(nodes: int, pages: int, fanout: int, meta_ratio: float) -> Dict[str, float]:
+    """Returns the seconds spent in each phase for a tree of the given size"""
+    items, meta = build_tree(nodes, pages, fanout, meta_ratio)
+    options = Options(filename=".pages", collapse_single_pages=False, strict=False)
+
+    profiler.configure(True)
+    with mock.patch("mkdocs_awesome_pages_plugin.navigation.NavigationMeta", meta), contextlib.redirect_stdout(None):
+        start = time.perf_counter()
+        navigation = AwesomeNavigation(items, options, DOCS_DIR, set())
+        process_children = time.perf_counter() - start
+    summary = profiler.summary()
+    profiler.configure(False)
+
+    start = time.perf_counter()
+    navigation.to_mkdocs()
+    to_mkdocs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_by_type(navigation.items, Page)
+    get_by_type(navigation.items, Section)
+    by_type = time.perf_counter() - start
+
+    return {
+        "AwesomeNavigation._process_children": process_children,
+        "AwesomeNavigation._order": summary.get("AwesomeNavigation._order", {}).get("seconds", 0.0),
+        "AwesomeNavigation._nav": summary.get("AwesomeNavigation._nav", {}).get("seconds", 0.0),
+        "AwesomeNavigation.to_mkdocs": to_mkdocs,
+        "get_by_type": by_type,
+    }
+
+
+def scaling(sizes: List[int], timings: List[float]) -> List[Optional[float]]:
+    """Returns the exponents k of `time ~ size^k` between each size and the previous one"""
+    exponents = [None]
+    for index in range(1, len(sizes)):
+        if timings[index - 1] > 0 and timings[index] > 0:
+            exponents.append(math.log(timings[index] / timings[index - 1]) / math.log(sizes[index] / sizes[index - 1]))
+        else:
+            exponents.append(None)
+    return exponents
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.navigation", description="Times the navigation processing on in-memory trees"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="number of nodes")
+    parser.add_argument("--pages", type=int, default=10, help="pages per section")
+    parser.add_argument("--fanout", type=int, default=3, help="subsections per section")
+    parser.add_argument("--meta-ratio", type=float, default=0.5, help="share of sections with a nav")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size, the fastest is reported")
+    parser.add_argument("--json", help="path of a JSON file to write the results to")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(args.sizes)
+    results = {phase: [] for phase in PHASES}
+    for size in sizes:
+        runs = [measure(size, args.pages, args.fanout, args.meta_ratio) for _ in range(args.repeat)]
+        for phase in PHASES:
+            results[phase].append(min(run[phase] for run in runs))
+
+    print("{:<38}".format("phase") + "".join("{:>14}".format("{} ms".format(size)) for size in sizes))
+    for phase in PHASES:
+        print("{:<38}".format(phase) + "".join("{:>14.2f}".format(timing * 1000) for timing in results[phase]))
+    print()
+    print("{:<38}".format("scaling exponent") + "".join("{:>14}".format(size) for size in sizes))
+    for phase in PHASES:
+        exponents = scaling(sizes, results[phase])
+        print(
+            "{:<38}".format(phase)
+            + "".join("{:>14}".format("-" if value is None else "{:.2f}".format(value)) for value in exponents)
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"sizes": sizes, "seconds": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Times the plugin on synthetic docs trees
+
+Two scenarios are measured for every tree:
+
+- `nav`: construction of the awesome navigation (the `on_nav` hook) from a freshly built MkDocs navigation, once with
+  cold caches and once with the meta files and processed sections of the previous run, like a `mkdocs serve` rebuild
+- `build`: a full `mkdocs build`
+
+Example:
+
+    python -m benchmarks.run --depth 3 --fanout 5 --pages 20 --repeat 5 --json results.json
+
+The plugin has to be installed (e.g. with `poetry install`) for MkDocs to find it.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+import warnings
+from typing import Callable, Dict, List, Optional
+
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+from mkdocs.structure.files import get_files
+from mkdocs.structure.nav import get_navigation
+
+from mkdocs_awesome_pages_plugin.cache import MetaCache
+from mkdocs_awesome_pages_plugin.navigation import ProcessedSections
+
+from .tree import TreeSpec, generate_tree
+
+SCENARIOS = ("nav", "build")
+
+
+def main(argv: Optional[List[str]] = None):
+    defaults = TreeSpec()
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Times the plugin on synthetic docs")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="levels of folders below the docs root")
+    parser.add_argument("--fanout", type=int, default=defaults.fanout, help="subfolders per folder")
+    parser.add_argument("--pages", type=int, default=defaults.pages, help="pages per folder, besides index.md")
+    parser.add_argument("--meta-ratio", type=float, default=defaults.meta_ratio, help="share of folders with .pages")
+    parser.add_argument("--rest-patterns", type=int, default=defaults.rest_patterns, help="glob rest entries per nav")
+    parser.add_argument("--env-conditions", type=int, default=defaults.env_conditions, help="env conditions per nav")
+    parser.add_argument("--filter-not-referenced", action="store_true", help="enable filter_not_referenced")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="scenarios to run, default is all")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--json", help="path of a JSON file to write the results to")
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec(
+        depth=args.depth,
+        fanout=args.fanout,
+        pages=args.pages,
+        meta_ratio=args.meta_ratio,
+        rest_patterns=args.rest_patterns,
+        env_conditions=args.env_conditions,
+        filter_not_referenced=args.filter_not_referenced,
+        seed=args.seed,
+    )
+    results = run(spec, args.scenario or SCENARIOS, args.repeat)
+
+    print(spec.describe())
+    print("{:<12} {:>10} {:>10} {:>10}".format("scenario", "min ms", "median ms", "max ms"))
+    for name, timings in results["timings"].items():
+        print(
+            "{:<12} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                name, min(timings) * 1000, statistics.median(timings) * 1000, max(timings) * 1000
+            )
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+def run(spec: TreeSpec, scenarios: List[str], repeat: int) -> dict:
+    """Generates the tree described by `spec` and returns the timings of the given scenarios in seconds"""
+    logging.getLogger("mkdocs").setLevel(logging.ERROR)
+
+    timings: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as directory, _environment(spec):
+        docs_dir = os.path.join(directory, "docs")
+        stats = generate_tree(spec, docs_dir)
+        config_file = os.path.join(directory, "mkdocs.yml")
+        with open(config_file, "w", encoding="utf-8") as file:
+            file.write("site_name: Benchmark\nplugins:\n    - awesome-pages\n")
+
+        def config():
+            return load_config(config_file=config_file, docs_dir=docs_dir, site_dir=os.path.join(directory, "site"))
+
+        if "nav" in scenarios:
+            timings["nav (cold)"] = _repeat(repeat, lambda: _time_nav(config(), cold=True))
+            timings["nav (warm)"] = _repeat(repeat, lambda: _time_nav(config(), cold=False))
+        if "build" in scenarios:
+            timings["build"] = _repeat(repeat, lambda: _time(lambda: build(config())))
+
+    return {"spec": spec._asdict(), "stats": stats._asdict(), "timings": timings}
+
+
+def _time_nav(config, cold: bool) -> float:
+    plugin = config["plugins"]["awesome-pages"]
+    config = plugin.on_config(config)
+    files = get_files(config)
+    plugin.on_pre_build(config)
+    plugin.on_files(files, config)
+    nav = get_navigation(files, config)
+    if cold:
+        # on_files already loaded the meta files of the folders containing pages
+        MetaCache.clear()
+        ProcessedSections.clear()
+        plugin.meta_cache = MetaCache(plugin.config["filename"])
+    return _time(lambda: plugin.on_nav(nav, config, files))
+
+
+def _time(function: Callable) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _repeat(repeat: int, measure: Callable[[], float]) -> List[float]:
+    with warnings.catch_warnings(), contextlib.redirect_stdout(io.StringIO()):
+        # the plugin reports missing entries and removed files on stdout and as warnings, which would skew the timings
+        warnings.simplefilter("ignore")
+        return [measure() for _ in range(repeat)]
+
+
+@contextlib.contextmanager
+def _environment(spec: TreeSpec):
+    # only the first of the alternating env condition variables is set
+    variable = spec.ENV_VARIABLE + "0"
+    previous = os.environ.get(variable)
+    os.environ[variable] = "1"
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[variable]
+        else:
+            os.environ[variable] = previous
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Generation of synthetic `docs_dir` trees of configurable size and shape"""
+
+import os
+import random
+from typing import List, NamedTuple
+
+import yaml
+
+
+class TreeSpec(NamedTuple):
+    depth: int = 3
+    fanout: int = 4
+    pages: int = 10
+    meta_ratio: float = 0.5
+    rest_patterns: int = 1
+    env_conditions: int = 0
+    filter_not_referenced: bool = False
+    seed: int = 0
+
+    ENV_VARIABLE = "AWESOME_PAGES_BENCHMARK_ENV"
+
+    @property
+    def folders(self) -> int:
+        return sum(self.fanout**level for level in range(self.depth + 1))
+
+    def describe(self) -> str:
+        return (
+            "depth={s.depth} fanout={s.fanout} pages={s.pages} meta_ratio={s.meta_ratio} rest_patterns={s.rest_patterns}"
+            " env_conditions={s.env_conditions} filter_not_referenced={s.filter_not_referenced}".format(s=self)
+        )
+
+
+class TreeStats(NamedTuple):
+    folders: int
+    pages: int
+    meta_files: int
+    assets: int
+
+
+def generate_tree(spec: TreeSpec, docs_dir: str) -> TreeStats:
+    """Writes a docs tree following the given spec into `docs_dir`
+
+    Every folder contains an `index.md` and `spec.pages` pages. A `spec.meta_ratio` share of the folders (always
+    including the root) get a `.pages` file whose nav lists the first pages explicitly, `spec.rest_patterns` glob rest
+    entries and a final `...`. The first `spec.env_conditions` pages of each nav are guarded by an env condition that
+    alternates between a set and an unset variable. With `spec.filter_not_referenced`, the root `.pages` enables the
+    filter and every folder gets two assets of which only the first is linked.
+    """
+    generator = random.Random(spec.seed)
+    stats = {"folders": 0, "pages": 0, "meta_files": 0, "assets": 0}
+    _generate_folder(spec, generator, docs_dir, 0, stats)
+    return TreeStats(**stats)
+
+
+def _generate_folder(spec: TreeSpec, generator: random.Random, path: str, level: int, stats: dict):
+    os.makedirs(path, exist_ok=True)
+    stats["folders"] += 1
+
+    pages = ["page-{}.md".format(index) for index in range(spec.pages)]
+    asset = "asset-linked.png" if spec.filter_not_referenced else None
+
+    _write(os.path.join(path, "index.md"), _page_contents("Index", asset))
+    for page in pages:
+        _write(os.path.join(path, page), _page_contents(page[:-3].replace("-", " ").title(), asset))
+    stats["pages"] += len(pages) + 1
+
+    if spec.filter_not_referenced:
+        for name in ("asset-linked.png", "asset-unlinked.png"):
+            _write(os.path.join(path, name), "")
+        stats["assets"] += 2
+
+    if level == 0 or generator.random() < spec.meta_ratio:
+        _write(os.path.join(path, ".pages"), _meta_contents(spec, pages, level == 0))
+        stats["meta_files"] += 1
+
+    if level < spec.depth:
+        for index in range(spec.fanout):
+            _generate_folder(spec, generator, os.path.join(path, "section-{}".format(index)), level + 1, stats)
+
+
+def _page_contents(title: str, asset: str = None) -> str:
+    contents = "# {}\n\nSome text.\n".format(title)
+    if asset is not None:
+        contents += "\n![image]({})\n".format(asset)
+    return contents
+
+
+def _meta_contents(spec: TreeSpec, pages: List[str], root: bool) -> str:
+    nav = ["index.md"]
+    for index, page in enumerate(pages[: spec.env_conditions]):
+        nav.append("{} | env=[{}{}]".format(page, spec.ENV_VARIABLE, index % 2))
+    for index in range(spec.rest_patterns):
+        nav.append("... | glob=page-{}*".format(index))
+    nav.append("...")
+
+    data = {"nav": nav}
+    if root and spec.filter_not_referenced:
+        data["filter_not_referenced"] = True
+    return yaml.dump(data)
+
+
+def _write(path: str, contents: str):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(contents)
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import warnings
+from pathlib import PurePath
+from typing import Dict, Optional, Tuple
+
+from .meta import Meta
+
+StatSignature = Tuple[int, int, int]
+
+
+class MetaIndexNotSaved(Warning):
+    def __init__(self, path: str, error: OSError):
+        super().__init__('Could not save the meta index to "{path}": {error}'.format(path=path, error=error))
+
+
+class MetaCache:
+    """Build-scoped cache of the meta files, keyed by the directory containing them
+
+    Parsed meta files are additionally kept for the lifetime of the process and reused by later builds (e.g. the
+    rebuilds of `mkdocs serve`) as long as the modification time, size and inode of the file are unchanged. `prune`
+    drops those not used by the current build, so that the files of removed directories are not kept forever.
+    """
+
+    _parsed: Dict[str, Tuple[StatSignature, Meta]] = {}
+
+    def __init__(self, filename: str, index: Optional["MetaIndex"] = None):
+        self.filename = filename
+        self.index = index
+        self._metas: Dict[str, Tuple[Optional[StatSignature], Meta]] = {}
+
+    def get(self, directory: Optional[str]) -> Meta:
+        if directory is None:
+            return Meta()
+        return self._get(directory)[1]
+
+    def signature(self, directory: Optional[str]) -> Optional[StatSignature]:
+        """Returns the stat signature of the meta file of a directory, None if there is none"""
+        if directory is None:
+            return None
+        return self._get(directory)[0]
+
+    def _get(self, directory: str) -> Tuple[Optional[StatSignature], Meta]:
+        entry = self._metas.get(directory)
+        if entry is None:
+            entry = self._metas[directory] = self._load(os.path.join(directory, self.filename), self.index)
+        return entry
+
+    @classmethod
+    def _load(cls, path: str, index: Optional["MetaIndex"]) -> Tuple[Optional[StatSignature], Meta]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            cls._parsed.pop(path, None)
+            return None, Meta(path=path)
+
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = cls._parsed.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached
+
+        meta = Meta.try_load_from(path, index)
+        cls._parsed[path] = (signature, meta)
+        return signature, meta
+
+    def prune(self):
+        """Drops the parsed meta files that were not used by the build of this cache"""
+        used = {os.path.join(directory, self.filename) for directory in self._metas}
+        for path in [path for path in self._parsed if path not in used]:
+            del self._parsed[path]
+
+    @classmethod
+    def clear(cls):
+        cls._parsed.clear()
+
+
+class MetaIndex:
+    """On-disk index of validated meta file contents, keyed by path and validated by the hash of the file contents
+
+    Allows fresh processes (e.g. CI builds) to skip parsing and validating meta files that did not change since the
+    index was written. Paths are stored relative to `base_dir`, so the index stays valid when it is restored into a
+    checkout at another location.
+    """
+
+    FILENAME = "meta-index.json"
+    VERSION = 3
+
+    def __init__(self, directory: str, base_dir: str):
+        self.path = os.path.join(directory, self.FILENAME)
+        self.base_dir = base_dir
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == self.VERSION and isinstance(data.get("entries"), dict):
+            self._entries = data["entries"]
+
+    def get(self, path: str, source: str) -> Optional[dict]:
+        entry = self._entries.get(self._key(path))
+        if entry is not None and entry.get("hash") == self._hash(source):
+            return entry.get("contents")
+
+    def put(self, path: str, source: str, contents: dict):
+        self._entries[self._key(path)] = {"hash": self._hash(source), "contents": contents}
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+
+        entries = {
+            key: entry for key, entry in self._entries.items() if os.path.exists(os.path.join(self.base_dir, key))
+        }
+
+        # the index is optional, a cache directory that can't be written must not fail the build
+        temp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": self.VERSION, "entries": entries}, file)
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            warnings.warn(MetaIndexNotSaved(self.path, error))
+            return
+
+        self._entries = entries
+        self._dirty = False
+
+    def _key(self, path: str) -> str:
+        return PurePath(os.path.relpath(path, self.base_dir)).as_posix()
+
+    @staticmethod
+    def _hash(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
@@ -0,0 +1,87 @@
+import datetime
+import os
+import re
+from typing import Any, Optional
+
+import yaml
+
+_DELIMITERS = ("---", "...")
+_HEADING = re.compile(r"^#\s+(.+?)(?:\s+#+)?\s*$")
+_SETEXT_UNDERLINE = re.compile(r"^=+\s*$")
+
+
+class PageHeader:
+    """Front matter and title of a Markdown page, read before MkDocs reads the page sources"""
+
+    def __init__(self, meta: dict, title: Optional[str]):
+        self.meta = meta
+        self.title = title
+
+
+def read_header(path: str, title: bool = True) -> PageHeader:
+    """Reads the YAML front matter of a page and, if `title` is set, the level 1 heading it starts with
+
+    Only the beginning of the file is read: the front matter, then the first content block. Like MkDocs, a heading
+    is only used as the title if it is the first content of the page. Returns an empty header if the file cannot be
+    read.
+    """
+    meta = {}
+    heading = None
+    try:
+        with open(path, encoding="utf-8-sig") as file:
+            line = file.readline()
+            if line.rstrip() == "---":
+                lines = []
+                line = file.readline()
+                while line and line.rstrip() not in _DELIMITERS:
+                    lines.append(line)
+                    line = file.readline()
+                try:
+                    data = yaml.safe_load("".join(lines))
+                except yaml.YAMLError:
+                    data = None
+                if isinstance(data, dict):
+                    meta = data
+                line = file.readline()
+
+            if title and not isinstance(meta.get("title"), str):
+                while line and not line.strip():
+                    line = file.readline()
+                match = _HEADING.match(line)
+                if match:
+                    heading = match.group(1)
+                elif line and _SETEXT_UNDERLINE.match(file.readline()):
+                    heading = line.strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    if isinstance(meta.get("title"), str):
+        heading = meta["title"]
+    return PageHeader(meta, heading)
+
+
+def title_from_filename(path: str) -> str:
+    """Returns the title MkDocs derives from the filename of a page without a title"""
+    title = os.path.splitext(os.path.basename(path))[0].replace("-", " ").replace("_", " ")
+    if title.lower() == title:
+        title = title.capitalize()
+    return title
+
+
+def parse_date(value: Any) -> Optional[datetime.datetime]:
+    """Converts the `date` of a front matter to a naive UTC datetime, returns None if it isn't a valid date
+
+    YAML already converts unquoted dates, quoted ones are parsed with the same rules.
+    """
+    if isinstance(value, str):
+        try:
+            value = yaml.safe_load(value)
+        except yaml.YAMLError:
+            return None
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    return None
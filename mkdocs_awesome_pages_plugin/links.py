@@ -0,0 +1,48 @@
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+
+class LinkExtractor(HTMLParser):
+    """Collects the local paths referenced by the attributes of any HTML element
+
+    Covers e.g. `<a href>`, `<img src srcset>`, `<source src srcset>`, `<video src poster>` and `<link href>`.
+    URLs with a scheme or host (`https://`, `mailto:`, `data:`, ...) and fragment-only links are skipped, query strings
+    and fragments are stripped.
+    """
+
+    URL_ATTRIBUTES = {"href", "src", "poster", "data"}
+    SRCSET_ATTRIBUTE = "srcset"
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paths: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        for name, value in attrs:
+            if not value:
+                continue
+            if name in self.URL_ATTRIBUTES:
+                self._add(value)
+            elif name == self.SRCSET_ATTRIBUTE:
+                for candidate in value.split(","):
+                    candidate = candidate.strip()
+                    if candidate:
+                        self._add(candidate.split()[0])
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.handle_starttag(tag, attrs)
+
+    def _add(self, url: str):
+        parts = urlsplit(url.strip())
+        if parts.scheme or parts.netloc or not parts.path:
+            return
+        self.paths.append(unquote(parts.path))
+
+
+def extract_links(html: str) -> List[str]:
+    """Returns the local paths referenced in the given HTML, in document order"""
+    extractor = LinkExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.paths
@@ -0,0 +1,47 @@
+"""Manifest of the files that `filter_not_referenced` removes (or would remove) from the site
+
+The manifest can be used by deploy steps to skip unreferenced files, e.g.:
+
+    python -m mkdocs_awesome_pages_plugin.manifest manifest.json --prefix / > exclude.txt
+    rsync -r --exclude-from=exclude.txt site/ remote:site/
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional
+
+
+def write_manifest(path: str, site_dir: str, sizes: Dict[str, int]):
+    """Writes the manifest for the given files, mapping their paths inside the site directory to their size"""
+    data = {
+        "site_dir": site_dir,
+        "files": [os.path.relpath(file, site_dir).replace(os.sep, "/") for file in sorted(sizes)],
+        "total_bytes": sum(sizes.values()),
+    }
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+
+
+def read_manifest(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m mkdocs_awesome_pages_plugin.manifest",
+        description="Prints the files listed in a filter manifest, one per line and relative to the site directory",
+    )
+    parser.add_argument("manifest", help="path of the manifest written by the filter_manifest option")
+    parser.add_argument("--prefix", default="", help="string prepended to every path, e.g. / for rsync patterns")
+    args = parser.parse_args(argv)
+
+    for file in read_manifest(args.manifest)["files"]:
+        print(args.prefix + file)
+
+
+if __name__ == "__main__":
+    main()
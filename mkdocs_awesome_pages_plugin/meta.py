@@ -1,13 +1,16 @@
 import collections.abc
+import functools
+import os
 import re
-import pycond as pc
 from enum import Enum
 from pathlib import PurePath
-from typing import Optional, List, Union, Any, Iterator
+from typing import Optional, List, Union, Any, Iterator, Pattern, Callable, AbstractSet, Dict, FrozenSet
 
 import yaml
 from wcmatch import glob
 
+from .profiling import profiler
+
 
 class DuplicateRestItemError(Exception):
     def __init__(self, item: str, context: str):
@@ -51,27 +54,77 @@ class MetaNavItem:
 
 class MetaNavEnvCondition(MetaNavItem):
 
-    _REGEX = r"^((?:[a-zA-z\d_\-\.])+)\s+\|\s+env=(\[?(?:[A-Za-z\d_\-]+)\]?(?:\s+(?:(?:or)|(?:and))\s+\[?(?:[A-Za-z\d_\-]+)\]?)*)"
+    _REGEX = re.compile(
+        r"^((?:[a-zA-z\d_\-\.])+)\s+\|\s+env=(\[?(?:[A-Za-z\d_\-]+)\]?(?:\s+(?:(?:or)|(?:and))\s+\[?(?:[A-Za-z\d_\-]+)\]?)*)"
+    )
 
     def __init__(self, value: str):
-        match = re.match(MetaNavEnvCondition._REGEX, value)
+        match = MetaNavEnvCondition._REGEX.match(value)
 
-        super().__init__(match.group(1))        
-        expre = match.group(2)
-        self.valid =  pc.pycond(expre)()
-        self.expre = expre
+        super().__init__(match.group(1))
+        self.expre = match.group(2)
+
+    def is_valid(self) -> bool:
+        return EnvConditions.evaluate(self.expre)
 
-    def is_valid(self) -> bool:        
-        return self.valid
-    
     def print_explaination(self):
-        print("Awesome_page: MetaNavEnvCondition valid " + str(self.valid) + " value " + self.value + " expre " + self.expre)
+        print("Awesome_page: MetaNavEnvCondition valid " + str(self.is_valid()) + " value " + self.value + " expre " + self.expre)
 
     @staticmethod
     def is_env_condition(item: Any):
-        return isinstance(item, str) and re.search(MetaNavEnvCondition._REGEX, item)
+        return isinstance(item, str) and MetaNavEnvCondition._REGEX.search(item)
+
+
+
+
+class EnvConditions:
+    """Evaluates the env= conditions of nav items against a snapshot of the environment variables
+
+    A condition is a list of variable names, optionally in brackets, joined by `and` / `or`. A variable is true if it
+    is set. Without operator precedence, conditions are evaluated from right to left: `A and B or C` means
+    `A and (B or C)`. The compiled expressions are kept in a bounded cache, their results are memoized until `reset`
+    is called.
+    """
 
+    _environ: Optional[FrozenSet[str]] = None
+    _results: Dict[str, bool] = {}
 
+    @classmethod
+    def evaluate(cls, expression: str) -> bool:
+        result = cls._results.get(expression)
+        if result is None:
+            result = cls._results[expression] = cls.compile(expression)(cls.environ())
+        return result
+
+    @classmethod
+    def environ(cls) -> FrozenSet[str]:
+        """Returns the names of the environment variables the conditions are evaluated against"""
+        if cls._environ is None:
+            cls._environ = frozenset(os.environ)
+        return cls._environ
+
+    @classmethod
+    def reset(cls):
+        cls._environ = None
+        cls._results.clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def compile(expression: str) -> Callable[[AbstractSet[str]], bool]:
+        tokens = expression.split()
+        names = [token.strip("[]") for token in tokens[::2]]
+        operators = [token == "and" for token in tokens[1::2]]
+
+        def condition(environ: AbstractSet[str]) -> bool:
+            result = names[-1] in environ
+            for name, is_and in zip(reversed(names[:-1]), reversed(operators)):
+                if is_and:
+                    result = result and name in environ
+                else:
+                    result = result or name in environ
+            return result
+
+        return condition
 
 
 class RestType(Enum):
@@ -82,12 +135,12 @@ class RestType(Enum):
 
 class MetaNavRestItem(MetaNavItem):
 
-    _REGEX = r"^\.{3}\s*(?:\|\s*(flat)\s*)?\s*(?:\|\s*(?:(regex|glob)=)?(.*))?"
+    _REGEX = re.compile(r"^\.{3}\s*(?:\|\s*(flat)\s*)?\s*(?:\|\s*(?:(regex|glob)=)?(.*))?")
 
     def __init__(self, value: str):
         super().__init__(value)
 
-        match = re.search(self._REGEX, value)
+        match = self._REGEX.search(value)
         if match.group(2) is not None:
             self.type = RestType(match.group(2))
         elif match.group(3) is not None:
@@ -97,30 +150,86 @@ class MetaNavRestItem(MetaNavItem):
 
         self.pattern = match.group(3)
         self.flat = match.group(1) is not None
+        self.regex = self._compile()
+
+    def _compile(self) -> Optional[Pattern]:
+        if self.type == RestType.GLOB:
+            # without the NEGATE flag, translating a glob pattern never produces exclusion patterns
+            include, _ = glob.translate(self.pattern, flags=glob.GLOBSTAR)
+            return re.compile("|".join(include))
+        elif self.type == RestType.REGEX:
+            return re.compile(self.pattern)
 
     def matches(self, path: Optional[str]) -> bool:
         if self.type == RestType.GLOB:
-            return path is not None and glob.globmatch(path, self.pattern, flags=glob.GLOBSTAR)
+            return path is not None and self.regex.fullmatch(path) is not None
         elif self.type == RestType.REGEX:
-            return path is not None and re.search(self.pattern, PurePath(path).as_posix()) is not None
+            return path is not None and self.regex.search(PurePath(path).as_posix()) is not None
         else:
             return True
 
     @staticmethod
     def is_rest(item: Any) -> bool:
-        return isinstance(item, str) and re.search(MetaNavRestItem._REGEX, item)
+        return isinstance(item, str) and MetaNavRestItem._REGEX.search(item)
 
 
 class RestItemList(collections.abc.Iterable):
+
+    _DEFAULT_FLAGS = re.compile("").flags
+
     def __init__(self):
         self.patterns = []
         self.all = None
+        self._regex = None
+        self._compiled = False
 
     def append(self, item: MetaNavRestItem):
         if item.type == RestType.ALL:
             self.all = item
         else:
             self.patterns.append(item)
+            self._compiled = False
+
+    def match(self, path: Optional[str]) -> Optional[MetaNavRestItem]:
+        """Returns the first rest item matching the path, testing all filter patterns in a single regex call"""
+        if path is not None and self.patterns:
+            regex = self._combined_regex()
+            if regex is not None and PurePath(path).as_posix() == path:
+                match = regex.match(path)
+                if match is not None:
+                    return self.patterns[int(match.lastgroup[1:])]
+            else:
+                for item in self.patterns:
+                    if item.matches(path):
+                        return item
+        return self.all
+
+    def _combined_regex(self) -> Optional[Pattern]:
+        if not self._compiled:
+            self._regex = self._combine(self.patterns)
+            self._compiled = True
+        return self._regex
+
+    @staticmethod
+    def _combine(patterns: List[MetaNavRestItem]) -> Optional[Pattern]:
+        # Every alternative ends with an empty group named after the index of its rest item, so the name of the last
+        # matched group identifies the first matching item. Patterns with capturing groups of their own would shift
+        # the group numbers of backreferences, and global inline flags like `(?i)` would apply to all alternatives
+        # (or fail to compile on recent Python versions), so neither can be combined.
+        alternatives = []
+        for index, item in enumerate(patterns):
+            if item.regex.groups or item.regex.flags != RestItemList._DEFAULT_FLAGS:
+                return None
+            if item.type == RestType.GLOB:
+                alternative = r"(?:{})\Z".format(item.regex.pattern)
+            else:
+                alternative = r"(?s:.*?)(?:{})".format(item.regex.pattern)
+            alternatives.append("{}(?P<_{}>)".format(alternative, index))
+
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
 
     def __iter__(self) -> Iterator[MetaNavRestItem]:
         yield from self.patterns
@@ -141,10 +250,18 @@ class Meta:
     COLLAPSE_SINGLE_PAGES_ATTRIBUTE = "collapse_single_pages"
     HIDE_ATTRIBUTE = "hide"
     ORDER_ATTRIBUTE = "order"
+    ORDER_BY_ATTRIBUTE = "order_by"
     FILTER_NOT_REFERENCED_ATTRIBUTE = "filter_not_referenced"
 
     ORDER_ASC = "asc"
     ORDER_DESC = "desc"
+    ORDER_LOCALE = "locale"
+
+    ORDER_BY_FILENAME = "filename"
+    ORDER_BY_NATURAL = "natural"
+    ORDER_BY_TITLE = "title"
+    ORDER_BY_MTIME = "mtime"
+    ORDER_BY_DATE = "date"
 
     def __init__(
         self,
@@ -157,6 +274,7 @@ class Meta:
         collapse_single_pages: bool = None,
         hide: bool = None,
         order: Optional[str] = None,
+        order_by: Optional[str] = None,
         filter_not_referenced: bool = None
     ):
 
@@ -172,118 +290,169 @@ class Meta:
         self.collapse_single_pages = collapse_single_pages
         self.hide = hide
         self.order = order
+        self.order_by = order_by
         self.filter_not_referenced = filter_not_referenced
 
     @staticmethod
-    def try_load_from(path: Optional[str]) -> "Meta":
+    def try_load_from(path: Optional[str], index: Optional["MetaIndex"] = None) -> "Meta":
         if path is None:
             return Meta()
         try:
-            return Meta.load_from(path)
+            return Meta.load_from(path, index)
         except FileNotFoundError:
             return Meta(path=path)
 
     @staticmethod
-    def load_from(path: str) -> "Meta":
+    @profiler.timed("Meta.load_from")
+    def load_from(path: str, index: Optional["MetaIndex"] = None) -> "Meta":
         with open(path, encoding="utf-8") as file:
-            contents = yaml.safe_load(file) or {}
-            title = contents.get(Meta.TITLE_ATTRIBUTE)
-            arrange = contents.get(Meta.ARRANGE_ATTRIBUTE)
-            nav = contents.get(Meta.NAV_ATTRIBUTE)
-            collapse = contents.get(Meta.COLLAPSE_ATTRIBUTE)
-            collapse_single_pages = contents.get(Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE)
-            hide = contents.get(Meta.HIDE_ATTRIBUTE)
-            order = contents.get(Meta.ORDER_ATTRIBUTE)
-            filter_not_referenced = contents.get(Meta.FILTER_NOT_REFERENCED_ATTRIBUTE)
-
-            if title is not None:
-                if not isinstance(title, str):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a string - got {type} [{context}]'.format(
-                            attribute=Meta.TITLE_ATTRIBUTE,
-                            type=type(title),
-                            context=path,
-                        )
+            source = file.read()
+
+        cached = index.get(path, source) if index is not None else None
+        if cached is not None:
+            contents = cached
+        else:
+            contents = Meta._validate(yaml.safe_load(source) or {}, path)
+
+        meta = Meta._from_contents(contents, path)
+
+        if index is not None and cached is None:
+            index.put(path, source, contents)
+
+        return meta
+
+    @staticmethod
+    def _validate(contents: dict, path: str) -> dict:
+        title = contents.get(Meta.TITLE_ATTRIBUTE)
+        arrange = contents.get(Meta.ARRANGE_ATTRIBUTE)
+        nav = contents.get(Meta.NAV_ATTRIBUTE)
+        collapse = contents.get(Meta.COLLAPSE_ATTRIBUTE)
+        collapse_single_pages = contents.get(Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE)
+        hide = contents.get(Meta.HIDE_ATTRIBUTE)
+        order = contents.get(Meta.ORDER_ATTRIBUTE)
+        order_by = contents.get(Meta.ORDER_BY_ATTRIBUTE)
+        filter_not_referenced = contents.get(Meta.FILTER_NOT_REFERENCED_ATTRIBUTE)
+
+        if title is not None:
+            if not isinstance(title, str):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a string - got {type} [{context}]'.format(
+                        attribute=Meta.TITLE_ATTRIBUTE,
+                        type=type(title),
+                        context=path,
                     )
-            if arrange is not None:
-                if not isinstance(arrange, list) or not all(isinstance(s, str) for s in arrange):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a list of strings - got {type} [{context}]'.format(
-                            attribute=Meta.ARRANGE_ATTRIBUTE,
-                            type=type(arrange),
-                            context=path,
-                        )
+                )
+        if arrange is not None:
+            if not isinstance(arrange, list) or not all(isinstance(s, str) for s in arrange):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a list of strings - got {type} [{context}]'.format(
+                        attribute=Meta.ARRANGE_ATTRIBUTE,
+                        type=type(arrange),
+                        context=path,
                     )
-                if arrange.count(Meta.ARRANGE_REST_TOKEN) > 1:
-                    raise DuplicateRestItemError("...", path)
-
-            if nav is not None:
-                if not isinstance(nav, list):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a list - got {type} [{context}]'.format(
-                            attribute=Meta.NAV_ATTRIBUTE, type=type(nav), context=path
-                        )
+                )
+            if arrange.count(Meta.ARRANGE_REST_TOKEN) > 1:
+                raise DuplicateRestItemError("...", path)
+
+        if nav is not None:
+            if not isinstance(nav, list):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a list - got {type} [{context}]'.format(
+                        attribute=Meta.NAV_ATTRIBUTE, type=type(nav), context=path
                     )
-                nav = [MetaNavItem.from_yaml(item, path) for item in nav]
-                checked = set()
-                for item in nav:
-                    if isinstance(item, MetaNavRestItem):
-                        if item in checked:
-                            raise DuplicateRestItemError(item.value, path)
-                        checked.add(item)
-
-            if collapse is not None:
-                if not isinstance(collapse, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.COLLAPSE_ATTRIBUTE,
-                            type=type(collapse),
-                            context=path,
-                        )
+                )
+
+        if collapse is not None:
+            if not isinstance(collapse, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.COLLAPSE_ATTRIBUTE,
+                        type=type(collapse),
+                        context=path,
                     )
-            if collapse_single_pages is not None:
-                if not isinstance(collapse_single_pages, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE,
-                            type=type(collapse_single_pages),
-                            context=path,
-                        )
+                )
+        if collapse_single_pages is not None:
+            if not isinstance(collapse_single_pages, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE,
+                        type=type(collapse_single_pages),
+                        context=path,
                     )
-            if hide is not None:
-                if not isinstance(hide, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.HIDE_ATTRIBUTE,
-                            type=type(hide),
-                            context=path,
-                        )
+                )
+        if hide is not None:
+            if not isinstance(hide, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.HIDE_ATTRIBUTE,
+                        type=type(hide),
+                        context=path,
                     )
-            if order is not None:
-                if order != Meta.ORDER_ASC and order != Meta.ORDER_DESC:
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be either "desc" or "asc" - got "{order}" [{context}]'.format(
-                            attribute=Meta.ORDER_ATTRIBUTE, order=order, context=path
-                        )
+                )
+        if order is not None:
+            if order not in (Meta.ORDER_ASC, Meta.ORDER_DESC, Meta.ORDER_LOCALE):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be one of "asc", "desc" or "locale" - got "{order}" '
+                    "[{context}]".format(attribute=Meta.ORDER_ATTRIBUTE, order=order, context=path)
+                )
+        if order_by is not None:
+            if order_by not in (
+                Meta.ORDER_BY_FILENAME,
+                Meta.ORDER_BY_NATURAL,
+                Meta.ORDER_BY_TITLE,
+                Meta.ORDER_BY_MTIME,
+                Meta.ORDER_BY_DATE,
+            ):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be one of "filename", "natural", "title", "mtime" or "date" '
+                    '- got "{order_by}" [{context}]'.format(
+                        attribute=Meta.ORDER_BY_ATTRIBUTE, order_by=order_by, context=path
                     )
-            if filter_not_referenced is not None:
-                if not isinstance(filter_not_referenced, bool):
-                    raise TypeError(
-                        'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
-                            attribute=Meta.FILTER_NOT_REFERENCED_ATTRIBUTE,
-                            type=type(filter_not_referenced),
-                            context=path,
-                        )
+                )
+        if filter_not_referenced is not None:
+            if not isinstance(filter_not_referenced, bool):
+                raise TypeError(
+                    'Expected "{attribute}" attribute to be a boolean - got {type} [{context}]'.format(
+                        attribute=Meta.FILTER_NOT_REFERENCED_ATTRIBUTE,
+                        type=type(filter_not_referenced),
+                        context=path,
                     )
+                )
+
+        validated = {
+            Meta.TITLE_ATTRIBUTE: title,
+            Meta.ARRANGE_ATTRIBUTE: arrange,
+            Meta.NAV_ATTRIBUTE: nav,
+            Meta.COLLAPSE_ATTRIBUTE: collapse,
+            Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE: collapse_single_pages,
+            Meta.HIDE_ATTRIBUTE: hide,
+            Meta.ORDER_ATTRIBUTE: order,
+            Meta.ORDER_BY_ATTRIBUTE: order_by,
+            Meta.FILTER_NOT_REFERENCED_ATTRIBUTE: filter_not_referenced,
+        }
+        return {attribute: value for attribute, value in validated.items() if value is not None}
 
-            return Meta(
-                title=title,
-                arrange=arrange,
-                nav=nav,
-                path=path,
-                collapse=collapse,
-                collapse_single_pages=collapse_single_pages,
-                hide=hide,
-                order=order,
-                filter_not_referenced = filter_not_referenced
-            )
+    @staticmethod
+    def _from_contents(contents: dict, path: str) -> "Meta":
+        nav = contents.get(Meta.NAV_ATTRIBUTE)
+        if nav is not None:
+            nav = [MetaNavItem.from_yaml(item, path) for item in nav]
+            checked = set()
+            for item in nav:
+                if isinstance(item, MetaNavRestItem):
+                    if item in checked:
+                        raise DuplicateRestItemError(item.value, path)
+                    checked.add(item)
+
+        return Meta(
+            title=contents.get(Meta.TITLE_ATTRIBUTE),
+            arrange=contents.get(Meta.ARRANGE_ATTRIBUTE),
+            nav=nav,
+            path=path,
+            collapse=contents.get(Meta.COLLAPSE_ATTRIBUTE),
+            collapse_single_pages=contents.get(Meta.COLLAPSE_SINGLE_PAGES_ATTRIBUTE),
+            hide=contents.get(Meta.HIDE_ATTRIBUTE),
+            order=contents.get(Meta.ORDER_ATTRIBUTE),
+            order_by=contents.get(Meta.ORDER_BY_ATTRIBUTE),
+            filter_not_referenced=contents.get(Meta.FILTER_NOT_REFERENCED_ATTRIBUTE),
+        )
@@ -1,25 +1,28 @@
-from locale import strcoll
-from operator import truediv
+import datetime
+import itertools
 import os
 import warnings
 from pathlib import Path
-from typing import List, Optional, Union, Set
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 
 from mkdocs.structure.nav import (
     Navigation as MkDocsNavigation,
     Section,
     Link,
-    _add_parent_links,
-    _add_previous_and_next_links,
 )
 from mkdocs.structure.pages import Page
 
-from .meta import Meta, MetaNavEnvCondition, MetaNavItem, MetaNavRestItem, RestItemList
+from .cache import MetaCache
+from .frontmatter import parse_date, read_header, title_from_filename
+from .meta import EnvConditions, Meta, MetaNavEnvCondition, MetaNavItem, MetaNavRestItem, RestItemList
 from .options import Options
-from .utils import dirname, basename, join_paths
+from .profiling import profiler
+from .sorting import collating, collation_key, natural_key
+from .utils import dirname, basename, modification_times
 
 NavigationItem = Union[Page, Section, Link]
+IndexPath = Tuple[int, ...]
 
 
 class NavEntryNotFound(Warning):
@@ -45,21 +48,86 @@ class VirtualSection(Section):
     pass
 
 
-class AwesomeNavigation:
+class ProcessedSections:
+    """Memo of processed sections, kept for the lifetime of the process to speed up the rebuilds of `mkdocs serve`
+
+    Sections are identified by keys interned from their title, directory, meta file signature and the keys of their
+    children, so a section only matches a section of a previous build if nothing changed in its subtree. The result of
+    processing a section is stored as a template that refers to the original items by their index path relative to
+    the section, and is replayed onto the objects of the new build. Only the sections of the latest build are kept.
+    """
+
+    _context: Optional[tuple] = None
+    _keys: Dict[tuple, int] = {}
+    _templates: Dict[Tuple[int, bool], tuple] = {}
+    _ids = itertools.count()
+
+    @classmethod
+    def prepare(cls, context: tuple):
+        """Drops the memo if the options or environment it was built with differ from the given ones"""
+        if context != cls._context:
+            cls.clear()
+            cls._context = context
+
+    @classmethod
+    def intern(cls, key: tuple) -> int:
+        result = cls._keys.get(key)
+        if result is None:
+            result = cls._keys[key] = next(cls._ids)
+        return result
+
+    @classmethod
+    def get(cls, key: int, collapse: bool) -> Optional[tuple]:
+        return cls._templates.get((key, collapse))
+
+    @classmethod
+    def put(cls, key: int, collapse: bool, template: tuple):
+        cls._templates[(key, collapse)] = template
+
+    @classmethod
+    def retain(cls, keys: AbstractSet[int]):
+        """Drops the keys and templates of the sections that are not part of the given keys"""
+        cls._keys = {key: value for key, value in cls._keys.items() if value in keys}
+        cls._templates = {key: value for key, value in cls._templates.items() if key[0] in keys}
 
-    DELETED_FILES: List[str] = []
+    @classmethod
+    def clear(cls):
+        cls._context = None
+        cls._keys.clear()
+        cls._templates.clear()
 
+
+class AwesomeNavigation:
     def __init__(
         self,
         items: List[NavigationItem],
         options: Options,
         docs_dir: str,
         explicit_sections: Set[Section],
+        meta_cache: Optional[MetaCache] = None,
+        deleted_files: Iterable[str] = (),
     ):
         self.options = options
         self.explicit_sections = explicit_sections
+        self.deleted_files = list(deleted_files)
+        self._modification_times: Dict[str, Dict[str, int]] = {}
+        self._dates: Dict[str, Optional[datetime.datetime]] = {}
 
-        self.meta = NavigationMeta(items, options, docs_dir, explicit_sections)
+        ProcessedSections.prepare(
+            (options.filename, options.collapse_single_pages, options.strict, docs_dir, EnvConditions.environ())
+        )
+        self.meta = NavigationMeta(items, options, docs_dir, explicit_sections, meta_cache)
+
+        # index paths and original titles of the items, to record and replay processed sections
+        self._positions: Dict[int, IndexPath] = {}
+        self._objects: Dict[IndexPath, NavigationItem] = {}
+        self._titles: Dict[int, Optional[str]] = {}
+        # titles of the sections when they are processed, i.e. after the nav of their parent possibly changed them
+        self._incoming_titles: Dict[int, Optional[str]] = {}
+        # processed section and template of the results of _process_section, by the id of the result
+        self._produced_by: Dict[int, Tuple[Section, Optional[tuple]]] = {}
+        if self.meta.signatures:
+            self._index_items(items)
 
         if self.meta.root.title is not None:
             warnings.warn(TitleInRootHasNoEffect(self.options.filename))
@@ -74,6 +142,9 @@ class AwesomeNavigation:
 
         self.items = self._process_children(items, collapse, self.meta.root)
 
+        # sections of previous builds that are gone from this one would otherwise be kept forever
+        ProcessedSections.retain({key for key in self.meta.signatures.values() if key is not None})
+
     def _process_children(self, children: List[NavigationItem], collapse: bool, meta: Meta) -> List[NavigationItem]:
         self._order(children, meta)
         children = self._nav(children, meta)
@@ -89,20 +160,52 @@ class AwesomeNavigation:
 
         return result
 
+    @profiler.timed("AwesomeNavigation._order")
     def _order(self, items: List[NavigationItem], meta: Meta):
-        if meta.order is not None:
-            items.sort(
-                key=lambda i: basename(self._get_item_path(i)),
-                reverse=meta.order == Meta.ORDER_DESC,
-            )
+        if meta.order is None and meta.order_by is None:
+            return
 
+        # the keys are computed once per item, sort() only compares them
+        if meta.order_by == Meta.ORDER_BY_MTIME:
+            keys = [self._get_item_mtime(item) for item in items]
+        elif meta.order_by == Meta.ORDER_BY_DATE:
+            keys = [self._get_item_date(item) for item in items]
+        elif meta.order_by == Meta.ORDER_BY_TITLE:
+            keys = self._text_keys(items, [self._get_item_title(item) or "" for item in items], meta)
+        else:
+            keys = self._text_keys(items, [self._get_item_basename(item) or "" for item in items], meta)
+
+        self._sort(items, keys, meta.order)
+
+    @staticmethod
+    def _text_keys(items: List[NavigationItem], texts: List[str], meta: Meta) -> list:
+        collate = meta.order == Meta.ORDER_LOCALE
+        if meta.order_by == Meta.ORDER_BY_NATURAL:
+            # without the extension of the pages, "page.md" sorts before "page1.md" and pages mix well with sections
+            texts = [os.path.splitext(text)[0] if isinstance(item, Page) else text for item, text in zip(items, texts)]
+            if not collate:
+                return [natural_key(text) for text in texts]
+            # the locale is switched once for all the keys instead of once per key
+            with collating():
+                return [natural_key(text, True) for text in texts]
+        if collate:
+            with collating():
+                return [collation_key(text) for text in texts]
+        return texts
+
+    @staticmethod
+    def _sort(items: List[NavigationItem], keys: list, order: Optional[str]):
+        indexes = sorted(range(len(items)), key=keys.__getitem__, reverse=order == Meta.ORDER_DESC)
+        items[:] = [items[index] for index in indexes]
+
+    @profiler.timed("AwesomeNavigation._nav")
     def _nav(self, items: List[NavigationItem], meta: Meta) -> List[NavigationItem]:
         if meta.nav is None:
             return items
 
-        items_by_basename = {basename(self._get_item_path(item)): item for item in items}
+        items_by_basename = {self._get_item_basename(item): item for item in items}
 
-        used_items = []
+        used_items = set()  # ids of the items, Page.__eq__ is expensive and doesn't reflect identity
         rest_items = RestItemList()
 
         def _make_nav_rec(meta_nav: List[MetaNavItem]) -> List[Union[NavigationItem, MetaNavRestItem]]:
@@ -119,7 +222,7 @@ class AwesomeNavigation:
                             item.title = meta_item.title
                         if meta_item.is_valid():                        
                             result.append(item)
-                        used_items.append(item)
+                        used_items.add(id(item))
 
                 elif isinstance(meta_item.value, list):
                     result.append(VirtualSection(meta_item.title, children=_make_nav_rec(meta_item.value)))
@@ -129,7 +232,7 @@ class AwesomeNavigation:
                     if meta_item.title is not None:
                         item.title = meta_item.title
                     result.append(item)
-                    used_items.append(item)
+                    used_items.add(id(item))
 
                 elif meta_item.title is not None:
                     result.append(Link(meta_item.title, meta_item.value))
@@ -137,7 +240,7 @@ class AwesomeNavigation:
                 else:
                     supposed_path = os.path.join(os.path.dirname(meta.path), meta_item.value)
                     nav_file_deleted = False
-                    for deleted_file in AwesomeNavigation.DELETED_FILES:
+                    for deleted_file in self.deleted_files:
                         if deleted_file.startswith(supposed_path):
                             nav_file_deleted = True
                             break
@@ -155,26 +258,46 @@ class AwesomeNavigation:
             rest = {rest_item: [] for rest_item in rest_items}
 
             for item in items:
-                if item not in used_items:
-                    path = basename(self._get_item_path(item))
-                    for rest_item in rest_items:
-                        if rest_item.matches(path):
-                            rest[rest_item].append(item)
-                            break
-
-            def _expand_rest_rec(result: List[Union[NavigationItem, MetaNavRestItem]]):
-                for index, item in enumerate(result):
+                if id(item) not in used_items:
+                    rest_item = rest_items.match(self._get_item_basename(item))
+                    if rest_item is not None:
+                        rest[rest_item].append(item)
+
+            def _expand_rest_rec(result: List[Union[NavigationItem, MetaNavRestItem]]) -> List[NavigationItem]:
+                expanded = []
+                for item in result:
                     if isinstance(item, MetaNavRestItem):
-                        result[index : index + 1] = rest[item]
-                    elif isinstance(item, Section):
-                        if item.children:
-                            _expand_rest_rec(item.children)
+                        expanded.extend(rest[item])
+                    else:
+                        # only virtual sections created from the nav can contain rest entries
+                        if isinstance(item, VirtualSection) and item.children:
+                            item.children = _expand_rest_rec(item.children)
+                        expanded.append(item)
+                return expanded
 
-            _expand_rest_rec(result)
+            result = _expand_rest_rec(result)
 
         return result
 
     def _process_section(self, section: Section, collapse_recursive: bool) -> Optional[NavigationItem]:
+        key = self.meta.signatures.get(id(section))
+        self._incoming_titles[id(section)] = section.title
+        template = ProcessedSections.get(key, collapse_recursive) if key is not None else None
+
+        if template is not None:
+            result = self._replay(self._positions[id(section)], template)
+        else:
+            result = self._process_section_contents(section, collapse_recursive)
+            if key is not None:
+                template = self._record(section, result)
+                if template is not None:
+                    ProcessedSections.put(key, collapse_recursive, template)
+
+        if result is not None:
+            self._produced_by[id(result)] = (section, template)
+        return result
+
+    def _process_section_contents(self, section: Section, collapse_recursive: bool) -> Optional[NavigationItem]:
         meta = self.meta.sections[section]
 
         if meta.hide is True:
@@ -195,12 +318,136 @@ class AwesomeNavigation:
         
         return self._collapse(section, meta.collapse, collapse_recursive)
 
+    def _index_items(self, items: List[NavigationItem]):
+        stack = [((), items)]
+        while stack:
+            base, children = stack.pop()
+            for index, item in enumerate(children):
+                path = base + (index,)
+                self._positions[id(item)] = path
+                self._objects[path] = item
+                self._titles[id(item)] = item.title
+                if item.children:
+                    stack.append((path, item.children))
+
+    def _record(self, section: Section, result: Optional[NavigationItem]) -> Optional[tuple]:
+        """Returns the template of the result of processing a section, None if it cannot be replayed"""
+        if result is None:
+            return ("none",)
+
+        children = self._record_items(self._positions[id(section)], section.children)
+        if children is None:
+            return None
+        if result is section:
+            # only the title from its own meta file, the one given by the parent is not part of the key
+            return ("section", (), self.meta.sections[section].title, children)
+        # collapsed into its only child
+        return children[0]
+
+    def _record_items(self, base: IndexPath, items: List[NavigationItem]) -> Optional[List[tuple]]:
+        nodes = []
+        for item in items:
+            produced = self._produced_by.get(id(item))
+            if produced is not None:
+                origin, template = produced
+                if template is None:
+                    return None
+                path = self._positions[id(origin)][len(base) :]
+                title = self._incoming_titles[id(origin)]
+                if title != self._titles[id(origin)]:
+                    # retitled by the nav of the recorded section, which is not run again when it is replayed
+                    nodes.append(("sub", path, template, title))
+                else:
+                    nodes.append(("sub", path, template))
+            elif isinstance(item, VirtualSection):
+                children = self._record_items(base, item.children)
+                if children is None:
+                    return None
+                nodes.append(("virtual", item.title, children))
+            elif id(item) in self._positions:
+                path = self._positions[id(item)][len(base) :]
+                if item.title != self._titles[id(item)]:
+                    nodes.append(("item", path, item.title))
+                else:
+                    nodes.append(("item", path))
+            elif isinstance(item, Link):
+                nodes.append(("link", item.title, item.url))
+            else:
+                return None
+        return nodes
+
+    def _replay(self, base: IndexPath, node: tuple) -> Optional[NavigationItem]:
+        kind = node[0]
+        if kind == "none":
+            return None
+        if kind == "sub":
+            if len(node) > 3:
+                self._objects[base + node[1]].title = node[3]
+            return self._replay(base + node[1], node[2])
+        if kind == "virtual":
+            return VirtualSection(node[1], children=[self._replay(base, child) for child in node[2]])
+        if kind == "link":
+            return Link(node[1], node[2])
+
+        item = self._objects[base + node[1]]
+        if kind == "section":
+            if node[2] is not None:
+                item.title = node[2]
+            item.children = [self._replay(base, child) for child in node[3]]
+        elif len(node) > 2:
+            item.title = node[2]
+        return item
+
     def _get_item_path(self, item: NavigationItem) -> Optional[str]:
+        paths = self.meta.paths.get(id(item))
+        if paths is not None:
+            return paths[0]
         if isinstance(item, Section):
             return dirname(self.meta.sections[item].path)
         elif isinstance(item, Page):
             return item.file.abs_src_path
 
+    def _get_item_title(self, item: NavigationItem) -> Optional[str]:
+        if isinstance(item, Section):
+            # the titles of the sections are only set from their meta files once they are processed
+            return self.meta.sections[item].title or item.title
+        if isinstance(item, Page) and item.title is None:
+            path = self._get_item_path(item)
+            return read_header(path).title or title_from_filename(path)
+        return item.title
+
+    def _get_item_mtime(self, item: NavigationItem) -> int:
+        path = self._get_item_path(item)
+        if path is None:
+            return 0
+        directory = os.path.dirname(path)
+        times = self._modification_times.get(directory)
+        if times is None:
+            # stat all entries of the directory at once instead of each item on its own
+            times = self._modification_times[directory] = modification_times(directory)
+        return times.get(os.path.basename(path), 0)
+
+    def _get_item_date(self, item: NavigationItem) -> Tuple[bool, datetime.datetime]:
+        """Returns the sort key of the front matter date of a page, or of the newest page of a section
+
+        Items without a date sort as the oldest ones.
+        """
+        if isinstance(item, Page):
+            path = self._get_item_path(item)
+            date = self._dates.get(path, False)
+            if date is False:
+                date = self._dates[path] = parse_date(read_header(path, title=False).meta.get("date"))
+            return (True, date) if date is not None else (False, datetime.datetime.min)
+        if isinstance(item, Section):
+            return max((self._get_item_date(child) for child in item.children), default=(False, datetime.datetime.min))
+        return False, datetime.datetime.min
+
+    def _get_item_basename(self, item: NavigationItem) -> Optional[str]:
+        paths = self.meta.paths.get(id(item))
+        if paths is not None:
+            return paths[1]
+        return basename(self._get_item_path(item))
+
     @staticmethod
     def _set_title(section: Section, meta: Meta):
         if meta.title is not None:
@@ -216,10 +463,35 @@ class AwesomeNavigation:
         return section
 
     def to_mkdocs(self) -> MkDocsNavigation:
-        pages = get_by_type(self.items, Page)
-        _add_previous_and_next_links(pages)
-        _add_parent_links(self.items)
-        return MkDocsNavigation(self.items, pages)
+        return MkDocsNavigation(self.items, self._link_items(self.items))
+
+    @staticmethod
+    def _link_items(items: List[NavigationItem]) -> List[Page]:
+        """Sets the parent and previous/next page links of all items and returns the pages, in a single traversal
+
+        Top-level items get no parent, they may have been moved out of their section by collapsing.
+        """
+        pages = []
+        previous = None
+        stack = [(None, iter(items))]
+        while stack:
+            parent, children = stack[-1]
+            for item in children:
+                item.parent = parent
+                if isinstance(item, Page):
+                    if previous is not None:
+                        previous.next_page = item
+                    # reset after linking the previous page, which is the same one if a page is listed twice in a row
+                    item.previous_page = previous
+                    item.next_page = None
+                    previous = item
+                    pages.append(item)
+                if item.children:
+                    stack.append((item, iter(item.children)))
+                    break
+            else:
+                stack.pop()
+        return pages
 
 
 class NavigationMeta:
@@ -229,32 +501,77 @@ class NavigationMeta:
         options: Options,
         docs_dir: str,
         explicit_sections: Set[Section],
+        meta_cache: Optional[MetaCache] = None,
     ):
         self.options = options
         self.sections = {}
+        # source path and basename of the pages and sections, keyed by the id of the item
+        self.paths: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        # keys of the sections in ProcessedSections, None if their processing cannot be memoized
+        self.signatures: Dict[int, Optional[int]] = {}
+        self._directories: Dict[str, bool] = {}
         self.docs_dir = docs_dir
-        self.explicit_sections = explicit_sections        
+        self.explicit_sections = explicit_sections
+        self.meta_cache = meta_cache if meta_cache is not None else MetaCache(options.filename)
 
         root_path = self._gather_metadata(items)
-        self.root = Meta.try_load_from(join_paths(root_path, self.options.filename))
+        self.root = self.meta_cache.get(root_path)
 
+    @profiler.timed("NavigationMeta._gather_metadata")
     def _gather_metadata(self, items: List[NavigationItem]) -> Optional[str]:
         paths = []
         for item in items:
             if isinstance(item, Page):
-                if Path(self.docs_dir) in Path(item.file.abs_src_path).parents:
-                    paths.append(item.file.abs_src_path)
+                path = item.file.abs_src_path
+                self.paths[id(item)] = (path, basename(path))
+                if self._in_docs_dir(os.path.dirname(path)):
+                    paths.append(path)
             elif isinstance(item, Section):
                 section_dir = self._gather_metadata(item.children)
                 if item in self.explicit_sections:
                     self.sections[item] = Meta()
+                    self.paths[id(item)] = (None, None)
+                    self.signatures[id(item)] = self._signature(item, None, None)
                 else:
                     if section_dir is not None:
                         paths.append(section_dir)
-                    self.sections[item] = Meta.try_load_from(join_paths(section_dir, self.options.filename))
+                    self.sections[item] = self.meta_cache.get(section_dir)
+                    self.paths[id(item)] = (section_dir, basename(section_dir))
+                    self.signatures[id(item)] = self._signature(
+                        item, section_dir, self.meta_cache.signature(section_dir)
+                    )
 
         return self._common_dirname(paths)
 
+    def _in_docs_dir(self, directory: str) -> bool:
+        # pathlib is slow, compare once per directory rather than once per page
+        inside = self._directories.get(directory)
+        if inside is None:
+            path = Path(directory)
+            inside = self._directories[directory] = Path(self.docs_dir) in (path, *path.parents)
+        return inside
+
+    def _signature(self, section: Section, section_dir: Optional[str], meta_signature: Any) -> Optional[int]:
+        # the order of these depends on the files themselves, not only on the meta files
+        if self.sections[section].order_by in (Meta.ORDER_BY_MTIME, Meta.ORDER_BY_DATE, Meta.ORDER_BY_TITLE):
+            return None
+
+        children = []
+        for child in section.children:
+            if isinstance(child, Section):
+                key = self.signatures.get(id(child))
+                if key is None:
+                    return None
+                children.append(key)
+            elif isinstance(child, Page):
+                children.append(("page", child.file.src_path, child.title))
+            else:
+                children.append(("link", child.title, getattr(child, "url", None)))
+
+        return ProcessedSections.intern(
+            (section.title, section in self.explicit_sections, section_dir, meta_signature, tuple(children))
+        )
+
     @staticmethod
     def _common_dirname(paths: List[Optional[str]]) -> Optional[str]:
         if paths:
@@ -266,10 +583,18 @@ class NavigationMeta:
 # Copy of mkdocs.structure.nav._get_by_type with fix for nested sections
 # PR: https://github.com/mkdocs/mkdocs/pull/2203
 def get_by_type(nav, T):
-    ret = []
-    for item in nav:
-        if isinstance(item, T):
-            ret.append(item)
-        if item.children:
-            ret.extend(get_by_type(item.children, T))
-    return ret
+    return list(iter_by_type(nav, T))
+
+
+def iter_by_type(nav, T) -> Iterator:
+    """Yields the items of the given type in depth-first order, iteratively to support deeply nested navigations"""
+    stack = [iter(nav)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, T):
+                yield item
+            if item.children:
+                stack.append(iter(item.children))
+                break
+        else:
+            stack.pop()
@@ -1,5 +1,24 @@
+from typing import List, Optional, Union
+
+
 class Options:
-    def __init__(self, *, filename: str, collapse_single_pages: bool, strict: bool):
+    def __init__(
+        self,
+        *,
+        filename: str,
+        collapse_single_pages: bool,
+        strict: bool,
+        cache_dir: Optional[str] = None,
+        filter_ignore: Optional[List[str]] = None,
+        filter_manifest: Optional[str] = None,
+        filter_dry_run: bool = False,
+        profile: Union[bool, str] = False
+    ):
         self.filename = filename
         self.collapse_single_pages = collapse_single_pages
         self.strict = strict
+        self.cache_dir = cache_dir
+        self.filter_ignore = filter_ignore
+        self.filter_manifest = filter_manifest
+        self.filter_dry_run = filter_dry_run
+        self.profile = profile
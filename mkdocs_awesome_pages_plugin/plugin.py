@@ -2,13 +2,11 @@ from curses import meta
 import math
 import warnings
 import os
-import pycond as pc
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional, Set
 
 from mkdocs.config import config_options, Config
 from mkdocs.plugins import BasePlugin
-from mkdocs.structure.files import Files, File
+from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 from mkdocs.structure.nav import (
     Navigation as MkDocsNavigation,
@@ -18,9 +16,14 @@ from mkdocs.structure.nav import (
 )
 from mkdocs.structure.pages import Page
 
-from .meta import DuplicateRestItemError, Meta, MetaNavEnvCondition, MetaNavRestItem, RestItemList
-from .navigation import AwesomeNavigation, get_by_type, NavigationItem
+from .cache import MetaCache, MetaIndex
+from .links import extract_links
+from .manifest import write_manifest
+from .meta import DuplicateRestItemError, EnvConditions, MetaNavEnvCondition, MetaNavRestItem, RestItemList
+from .navigation import AwesomeNavigation, iter_by_type, NavigationItem
 from .options import Options
+from .profiling import profiler
+from .utils import PathTrie, remove_files, walk_files
 
 
 class NavPluginOrder(Warning):
@@ -35,28 +38,54 @@ class NavPluginOrder(Warning):
 
 class AwesomePagesPlugin(BasePlugin):
 
-    REFERENCED_FILES_EXCEPT_HTML = []
-    FOLDERS_TO_CLEAN = []
-
     DEFAULT_META_FILENAME = ".pages"
+    DEFAULT_FILTER_IGNORE = ("assets", "search", "sitemap.xml", "sitemap.xml.gz")
     REST_PLACEHOLDER = "AWESOME_PAGES_REST"
 
     config_scheme = (
         ("filename", config_options.Type(str, default=DEFAULT_META_FILENAME)),
         ("collapse_single_pages", config_options.Type(bool, default=False)),
-        ("strict", config_options.Type(bool, default=True))
+        ("strict", config_options.Type(bool, default=True)),
+        ("cache_dir", config_options.Type(str, default=None)),
+        ("filter_ignore", config_options.Type(list, default=list(DEFAULT_FILTER_IGNORE))),
+        ("filter_manifest", config_options.Type(str, default=None)),
+        ("filter_dry_run", config_options.Type(bool, default=False)),
+        ("profile", config_options.Type((bool, str), default=False)),
     )
 
     def __init__(self):
         self.nav_config_with_rest = None
         self.rest_items = RestItemList()
         self.rest_blocks = {}
-        for variable_name in os.environ.keys():
-            print("Awesome_page: env var set " + variable_name)
-            pc.State[variable_name] = " "
+        self.meta_cache = None
+        self.meta_index = None
+        self.referenced_files = set()
+        self.pruned_files = {}
+        self.folders_to_clean = PathTrie()
+        self.deleted_files = []
+
+    def load_config(self, options: dict, config_file_path: Optional[str] = None):
+        result = super().load_config(options, config_file_path)
+        profiler.configure(self.config.get("profile", False), os.path.dirname(config_file_path or ""))
+        return result
+
+    @profiler.timed("on_pre_build")
+    def on_pre_build(self, config: Config):
+        EnvConditions.reset()
 
+        self.referenced_files = set()
+        self.pruned_files = {}
+        self.folders_to_clean = PathTrie()
+        self.deleted_files = []
+
+        self.meta_index = None
+        if self.config["cache_dir"]:
+            self.meta_index = MetaIndex(self._resolve_path(config, self.config["cache_dir"]), config["docs_dir"])
+
+        self.meta_cache = MetaCache(self.config["filename"], self.meta_index)
+
+    @profiler.timed("on_files")
     def on_files(self, files: Files, config: Config):
-        DELETED_FILES = []
         to_removes = []
         for file in files:        
             if file.is_documentation_page():
@@ -64,11 +93,10 @@ class AwesomePagesPlugin(BasePlugin):
                 filename = os.path.basename(abs_src_path).lower()
                 dir_src = os.path.dirname(abs_src_path)
                 dir_dest = os.path.dirname(file.abs_dest_path)
-                meta = Meta.try_load_from(os.path.join(dir_src, ".pages"))
+                meta = self.meta_cache.get(dir_src)
                 if meta != None and meta.nav != None:
                     if meta.filter_not_referenced:                        
-                        if(dir_dest not in self.FOLDERS_TO_CLEAN):
-                            self.FOLDERS_TO_CLEAN.append(dir_dest)
+                        self.folders_to_clean.add(dir_dest)
                     envs_meta = [env_meta for env_meta in meta.nav if isinstance(env_meta, MetaNavEnvCondition)]
                     for env_meta in envs_meta:
                         if env_meta.value.lower() == filename and not env_meta.is_valid():
@@ -79,61 +107,92 @@ class AwesomePagesPlugin(BasePlugin):
         for to_remove in to_removes:
             files.remove(to_remove)
         
-        AwesomeNavigation.DELETED_FILES.extend([to_remove.abs_src_path for to_remove in to_removes])
+        self.deleted_files.extend(to_remove.abs_src_path for to_remove in to_removes)
 
+    @profiler.timed("on_page_content")
     def on_page_content(self, html: str, page: Page, config: Config, files: Files):
-        #capture <a href="(path)">link name</a> or <img src="(path)"/>
-        regex_link = r"<\s*(?:(?:a)|(?:img))\s+(?:(?:(?:(?:href)|(?:src))=\"([^\"]*\.[^\"]+)\"\s*)|(?:[\w=]*(?:\"(?:(?:(?:\\\")|(?:[^\"]))*)\")?\s*))+\/?>"
-        found = False
-        for folder_to_clean in self.FOLDERS_TO_CLEAN:
-            if  str(page.file.abs_dest_path).startswith(folder_to_clean):
-                found = True
-                break
-        if found:
+        if self.folders_to_clean.covers(page.file.abs_dest_path):
             file_dirname = os.path.dirname(page.file.abs_dest_path)
-            for match in re.finditer(regex_link, html):
-                group = match.groups()[0]
-                if group is not None :
-                    if not group.lower().endswith(".html"):
-                        print("Awesome_page: on_page_content catch " + group)
-                        path = os.path.normpath(os.path.join(file_dirname, group))
-                        self.REFERENCED_FILES_EXCEPT_HTML.append(path)
+            for link in extract_links(html):
+                if not link.lower().endswith(".html"):
+                    if link.startswith("/"):
+                        path = os.path.join(config["site_dir"], link.lstrip("/"))
+                    else:
+                        path = os.path.join(file_dirname, link)
+                    self.referenced_files.add(os.path.normpath(path))
+
+    @profiler.timed("on_env")
+    def on_env(self, env, config: Config, files: Files):
+        # pages have been rendered at this point, but static files are not copied yet: drop the unreferenced ones from
+        # the filtered folders so they are neither copied nor deleted afterwards
+        if self.config["filter_dry_run"] or not self.folders_to_clean:
+            return env
+
+        ignored = PathTrie(self._ignored_paths())
+        for file in list(files):
+            if file.is_documentation_page():
+                continue
+            # files excluded from the build (MkDocs >= 1.5) are not copied anyway
+            inclusion = getattr(file, "inclusion", None)
+            if inclusion is not None and inclusion.is_excluded():
+                continue
+            path = os.path.normpath(file.abs_dest_path)
+            if path.lower().endswith(".html") or path.endswith(".css"):
+                continue
+            if self.folders_to_clean.covers(path) and not ignored.covers(path) and path not in self.referenced_files:
+                print("Awesome_page: not copied because not linked in filtered folder: " + path)
+                self.pruned_files[path] = file.abs_src_path
+                files.remove(file)
+
+        return env
 
     def on_post_build(self, config: Config):
-        to_removes = []
-        for folder_to_clean in self.FOLDERS_TO_CLEAN:
+        with profiler.measure("on_post_build"):
+            self._clean_filtered_folders(config)
+
+        if self.meta_index is not None:
+            self.meta_index.save()
+        if self.meta_cache is not None:
+            self.meta_cache.prune()
+
+        profiler.report()
+        profiler.clear()
+
+    def _clean_filtered_folders(self, config: Config):
+        roots = self.folders_to_clean.roots()
+        for folder_to_clean in roots:
             print("Awesome_page: post_build folder_to_clean " + folder_to_clean)
-            to_ignores = [os.path.join(folder_to_clean, to_ignore) for to_ignore in ["assets", "search", "sitemap.xml", "sitemap.xml.gz"]]
-            for source_dir, dirnames, filenames in os.walk(folder_to_clean, followlinks=True):
-                is_to_ignore = False
-                for to_ignore in to_ignores:
-                        if source_dir.startswith(to_ignore):
-                            is_to_ignore=True
-                            break
-                if is_to_ignore:
-                        continue
-                for filename in filenames:
-                    if str(filename).lower().endswith(".html"):
-                        continue
-                    path = os.path.normpath(os.path.join(source_dir, filename))
-                    is_to_ignore = False
-                    for to_ignore in to_ignores:
-                        if path.startswith(to_ignore):
-                            is_to_ignore=True
-                            break
-                    if is_to_ignore:
-                        continue
-                    if path not in self.REFERENCED_FILES_EXCEPT_HTML:
-                        if path not in to_removes and not path.endswith(".css"):
-                            to_removes.append(path)
-        for to_remove in to_removes:
+
+        # catches the files that were not pruned in on_env, e.g. those written by the theme or other plugins
+        to_removes = set()
+        with profiler.measure("post_build walk"):
+            for path in walk_files(roots, self._ignored_paths()):
+                if path.lower().endswith(".html") or path.endswith(".css"):
+                    continue
+                if path not in self.referenced_files:
+                    to_removes.add(path)
+
+        if self.config["filter_manifest"]:
+            sizes = {path: os.path.getsize(src_path) for path, src_path in self.pruned_files.items()}
+            sizes.update((path, os.path.getsize(path)) for path in to_removes)
+            write_manifest(self._resolve_path(config, self.config["filter_manifest"]), config["site_dir"], sizes)
+
+        if self.config["filter_dry_run"]:
+            print("Awesome_page: dry run, {} files not linked in filtered folders kept".format(len(to_removes)))
+            return
+
+        for to_remove in sorted(to_removes):
             print("Awesome_page: removed because not linked in filtered folder: " + to_remove)
-            os.remove(to_remove)
-            while len(os.listdir(os.path.dirname(to_remove))) == 0:
-                to_remove = os.path.dirname(to_remove)
-                os.rmdir(to_remove)
+        remove_files(to_removes, config["site_dir"])
 
+    def _ignored_paths(self) -> Set[str]:
+        return {
+            os.path.normpath(os.path.join(folder_to_clean, to_ignore))
+            for folder_to_clean in self.folders_to_clean
+            for to_ignore in self.config["filter_ignore"]
+        }
 
+    @profiler.timed("on_nav")
     def on_nav(self, nav: MkDocsNavigation, config: Config, files: Files):
         explicit_nav = nav if config["nav"] else None
 
@@ -142,15 +201,25 @@ class AwesomePagesPlugin(BasePlugin):
             config["nav"] = self.nav_config_with_rest
             explicit_nav = get_navigation(files, config)
 
-        explicit_sections = set(get_by_type(explicit_nav, Section)) if explicit_nav else set()
+        explicit_sections = set(iter_by_type(explicit_nav, Section)) if explicit_nav else set()
 
         if self.nav_config_with_rest:
-            self.rest_blocks = self._generate_rest_blocks(nav.items, [page.file for page in explicit_nav.pages])
+            self.rest_blocks = self._generate_rest_blocks(
+                nav.items, {page.file.src_path for page in explicit_nav.pages}
+            )
             self._insert_rest(explicit_nav.items)
             nav = explicit_nav
 
-        return AwesomeNavigation(nav.items, Options(**self.config), config["docs_dir"], explicit_sections).to_mkdocs()
+        return AwesomeNavigation(
+            nav.items,
+            Options(**self.config),
+            config["docs_dir"],
+            explicit_sections,
+            self.meta_cache,
+            self.deleted_files,
+        ).to_mkdocs()
 
+    @profiler.timed("on_config")
     def on_config(self, config: Config):
         for name, plugin in config["plugins"].items():
             if name == "awesome-pages":
@@ -166,6 +235,11 @@ class AwesomePagesPlugin(BasePlugin):
 
         return config
 
+    @staticmethod
+    def _resolve_path(config: Config, path: str) -> str:
+        """Resolves a path relative to the directory of the config file"""
+        return os.path.join(os.path.dirname(config["config_file_path"] or ""), path)
+
     def _find_rest(self, config):
         if isinstance(config, list):
             for index, element in enumerate(config):
@@ -183,26 +257,31 @@ class AwesomePagesPlugin(BasePlugin):
             for value in config.values():
                 self._find_rest(value)
 
+    @profiler.timed("_generate_rest_blocks")
     def _generate_rest_blocks(
-        self, items: List[NavigationItem], exclude_files: List[File]
+        self, items: List[NavigationItem], exclude_paths: Set[str]
     ) -> Dict[str, List[NavigationItem]]:
         result = {rest_item: [] for rest_item in self.rest_items}
-        for item in items[:]:  # loop over a shallow copy of items so removing items doesn't break iteration
+        remaining = []
+        for item in items:
             if isinstance(item, Page):
-                if item.file not in exclude_files:
-                    for rest_item in self.rest_items:
-                        if rest_item.matches(item.file.src_path):
-                            items.remove(item)
-                            result[rest_item].append(item)
-                            break
+                if item.file.src_path not in exclude_paths:
+                    rest_item = self.rest_items.match(item.file.src_path)
+                    if rest_item is not None:
+                        result[rest_item].append(item)
+                        continue
             if isinstance(item, Section):
-                child_result = self._generate_rest_blocks(item.children, exclude_files)
+                child_result = self._generate_rest_blocks(item.children, exclude_paths)
                 for rest_item, children in child_result.items():
                     if children:
                         if rest_item.flat:
                             result[rest_item].extend(children)
                         else:
                             result[rest_item].append(Section(item.title, children))
+            remaining.append(item)
+
+        # rebuild the list in place instead of removing matched items one by one, which would be quadratic
+        items[:] = remaining
         return result
 
     def _insert_rest(self, items):
@@ -0,0 +1,109 @@
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Union
+
+
+class Profiler:
+    """Records wall time and call counts of the plugin hooks and internal phases
+
+    Disabled by default, measuring costs a single attribute check then. Recursive calls of the same phase are counted,
+    but only the outermost call is timed so the time isn't counted twice.
+    """
+
+    ENV_VARIABLE = "AWESOME_PAGES_PROFILE"
+
+    def __init__(self):
+        self.enabled = False
+        self.output: Optional[str] = None
+        self._timings: Dict[str, List[float]] = {}
+        self._depths: Dict[str, int] = {}
+
+    def configure(self, option: Union[bool, str], base_dir: str = ""):
+        """Enables profiling if the option or the environment variable is set
+
+        A value ending in `.json` is the path of the JSON report to write, relative to `base_dir`. Otherwise the summary
+        is printed.
+        """
+        if not option:
+            option = os.environ.get(self.ENV_VARIABLE, "")
+            if option.lower() in ("", "0", "false"):
+                option = False
+
+        self.enabled = bool(option)
+        self.output = None
+        if isinstance(option, str) and option.lower().endswith(".json"):
+            self.output = os.path.join(base_dir, option)
+        self.clear()
+
+    def clear(self):
+        self._timings = {}
+        self._depths = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        depth = self._depths.get(name, 0)
+        self._depths[name] = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depths[name] = depth
+            timing = self._timings.setdefault(name, [0.0, 0])
+            timing[1] += 1
+            if depth == 0:
+                timing[0] += elapsed
+
+    def timed(self, name: str) -> Callable[[Callable], Callable]:
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.measure(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {"calls": calls, "seconds": seconds}
+            for name, (seconds, calls) in sorted(self._timings.items(), key=lambda item: -item[1][0])
+        }
+
+    def report(self):
+        """Prints the summary table or writes it as JSON, depending on the configuration"""
+        if not self.enabled:
+            return
+
+        summary = self.summary()
+        if self.output is not None:
+            os.makedirs(os.path.dirname(self.output) or ".", exist_ok=True)
+            with open(self.output, "w", encoding="utf-8") as file:
+                json.dump(summary, file, indent=2)
+        else:
+            width = max([len(name) for name in summary] + [len("phase")])
+            print("Awesome_page: profile")
+            print("{:<{width}} {:>8} {:>12} {:>12}".format("phase", "calls", "total ms", "mean ms", width=width))
+            for name, timing in summary.items():
+                print(
+                    "{:<{width}} {:>8} {:>12.2f} {:>12.3f}".format(
+                        name,
+                        timing["calls"],
+                        timing["seconds"] * 1000,
+                        timing["seconds"] * 1000 / timing["calls"],
+                        width=width,
+                    )
+                )
+
+
+profiler = Profiler()
@@ -0,0 +1,59 @@
+import contextlib
+import functools
+import locale
+import re
+from typing import Iterator, Tuple
+
+_DIGITS = re.compile(r"(\d+)")
+_collating = False
+
+
+@contextlib.contextmanager
+def collating() -> Iterator[None]:
+    """Switches to the collation of the locale configured by the environment (LC_ALL, LC_COLLATE, LANG)
+
+    Python starts with the "C" collation and the locale is global to the process, so the previous collation is
+    restored on exit to not affect MkDocs and the other plugins. Nested uses switch only once.
+    """
+    global _collating
+    if _collating:
+        yield
+        return
+
+    previous = locale.setlocale(locale.LC_COLLATE)
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+    _collating = True
+    try:
+        yield
+    finally:
+        _collating = False
+        locale.setlocale(locale.LC_COLLATE, previous)
+
+
+@functools.lru_cache(maxsize=65536)
+def collation_key(text: str) -> str:
+    """Returns the key sorting strings according to the collation rules of the locale of the environment"""
+    with collating():
+        return locale.strxfrm(text)
+
+
+@functools.lru_cache(maxsize=65536)
+def natural_key(text: str, collate: bool = False) -> Tuple[tuple, str]:
+    """Returns the key sorting strings with embedded numbers by their numeric value, e.g. `page2` before `page10`
+
+    Text parts are compared case-insensitively, or according to the locale of the environment if `collate` is set.
+    The string itself breaks ties.
+    """
+    parts = _DIGITS.split(text)
+    if not collate:
+        return _natural_key(parts, str.casefold), text
+    with collating():
+        return _natural_key(parts, locale.strxfrm), text
+
+
+def _natural_key(parts: list, transform) -> tuple:
+    # split() alternates text and digit parts, so the parts at the same index are always of the same type
+    return tuple(int(part) if index % 2 else transform(part) for index, part in enumerate(parts))
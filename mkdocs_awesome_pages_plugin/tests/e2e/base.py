@@ -30,6 +30,8 @@ class E2ETestCase(TestCase):
         collapse_single_pages: bool = None,
         hide: bool = None,
         order: Optional[str] = None,
+        order_by: Optional[str] = None,
+        filter_not_referenced: bool = None,
     ) -> Tuple[str, str]:
 
         data = self._removeDictNoneValues(
@@ -41,6 +43,8 @@ class E2ETestCase(TestCase):
                 "collapse_single_pages": collapse_single_pages,
                 "hide": hide,
                 "order": order,
+                "order_by": order_by,
+                "filter_not_referenced": filter_not_referenced,
             }
         )
 
@@ -84,16 +88,7 @@ class E2ETestCase(TestCase):
             self._addDummyPages(files, self.MIN_ROOT_ITEMS)
 
         with tempfile.TemporaryDirectory() as temp_directory, cd(temp_directory):
-            self._writeToFile("mkdocs.yml", yaml.dump(config))
-            self._createFiles("docs", files)
-
-            self._mkdocsBuild(
-                config_file="mkdocs.yml",
-                site_dir="dist",
-                docs_dir="docs",
-                site_name="E2E Tests",
-                strict=True,
-            )
+            self._build(config, files)
 
             # extract from 404 page because it's always generated and contains the navigation as well
             nav = self._extractNav("dist/404.html")
@@ -102,6 +97,29 @@ class E2ETestCase(TestCase):
                 item for item in nav if not (isinstance(item[1], str) and item[1].startswith("/" + self.DUMMY_NAME))
             ]
 
+    def mkdocsSiteFiles(self, config: dict, files: List[Union[str, Tuple[str, Union[str, list]]]]) -> List[str]:
+        """Builds the site and returns the paths of all files in the site directory, relative to it"""
+        with tempfile.TemporaryDirectory() as temp_directory, cd(temp_directory):
+            self._build(config, files)
+
+            return sorted(
+                os.path.relpath(os.path.join(directory, filename), "dist").replace(os.sep, "/")
+                for directory, _, filenames in os.walk("dist")
+                for filename in filenames
+            )
+
+    def _build(self, config: dict, files: List[Union[str, Tuple[str, Union[str, list]]]]):
+        self._writeToFile("mkdocs.yml", yaml.dump(config))
+        self._createFiles("docs", files)
+
+        self._mkdocsBuild(
+            config_file="mkdocs.yml",
+            site_dir="dist",
+            docs_dir="docs",
+            site_name="E2E Tests",
+            strict=True,
+        )
+
     def _addDummyPages(self, items: list, number_of_pages: int):
         items.extend(["{}{}.md".format(self.DUMMY_NAME, i) for i in range(number_of_pages)])
 
@@ -0,0 +1,166 @@
+import os
+import tempfile
+from unittest import mock
+
+from .base import E2ETestCase
+from ...manifest import read_manifest
+
+
+class TestFilterNotReferenced(E2ETestCase):
+    def _site(self, filter_not_referenced: bool = True):
+        return self.mkdocsSiteFiles(
+            self.config,
+            [
+                "index.md",
+                (
+                    "section",
+                    [
+                        self.pagesFile(nav=["index.md"], filter_not_referenced=filter_not_referenced),
+                        ("index.md", "![Referenced](img/referenced.png)\n\n[Download](files/data.zip)\n"),
+                        (
+                            "img",
+                            [
+                                ("referenced.png", "png"),
+                                ("unreferenced.png", "png"),
+                            ],
+                        ),
+                        ("files", [("data.zip", "zip"), ("other.zip", "zip")]),
+                        ("style.css", "css"),
+                    ],
+                ),
+                ("other", [("image.png", "png"), ("page.md", "")]),
+            ],
+        )
+
+    def test_unreferenced_files_removed(self):
+        site = self._site()
+
+        self.assertIn("section/img/referenced.png", site)
+        self.assertIn("section/files/data.zip", site)
+        self.assertNotIn("section/img/unreferenced.png", site)
+        self.assertNotIn("section/files/other.zip", site)
+
+    def test_css_kept(self):
+        self.assertIn("section/style.css", self._site())
+
+    def test_other_folders_kept(self):
+        self.assertIn("other/image.png", self._site())
+
+    def test_disabled(self):
+        site = self._site(filter_not_referenced=False)
+
+        self.assertIn("section/img/unreferenced.png", site)
+        self.assertIn("section/files/other.zip", site)
+
+    def test_default_ignore(self):
+        site = self.mkdocsSiteFiles(
+            self.config,
+            [
+                (
+                    "section",
+                    [
+                        self.pagesFile(nav=["index.md"], filter_not_referenced=True),
+                        ("index.md", ""),
+                        ("assets", [("unreferenced.png", "png")]),
+                        ("generated", [("unreferenced.png", "png")]),
+                    ],
+                ),
+            ],
+        )
+
+        self.assertIn("section/assets/unreferenced.png", site)
+        self.assertNotIn("section/generated/unreferenced.png", site)
+
+    def test_custom_ignore(self):
+        site = self.mkdocsSiteFiles(
+            {"plugins": [{"awesome-pages": {"filter_ignore": ["generated"]}}], "nav": None},
+            [
+                (
+                    "section",
+                    [
+                        self.pagesFile(nav=["index.md"], filter_not_referenced=True),
+                        ("index.md", ""),
+                        ("assets", [("unreferenced.png", "png")]),
+                        ("generated", [("unreferenced.png", "png")]),
+                    ],
+                ),
+            ],
+        )
+
+        self.assertNotIn("section/assets/unreferenced.png", site)
+        self.assertIn("section/generated/unreferenced.png", site)
+
+    def test_nested_folders(self):
+        site = self.mkdocsSiteFiles(
+            self.config,
+            [
+                (
+                    "section",
+                    [
+                        self.pagesFile(nav=["index.md", "nested"], filter_not_referenced=True),
+                        ("index.md", ""),
+                        (
+                            "nested",
+                            [
+                                self.pagesFile(nav=["index.md"], filter_not_referenced=True),
+                                ("index.md", "![Referenced](referenced.png)"),
+                                ("referenced.png", "png"),
+                                ("unreferenced.png", "png"),
+                            ],
+                        ),
+                    ],
+                ),
+            ],
+        )
+
+        self.assertIn("section/nested/referenced.png", site)
+        self.assertNotIn("section/nested/unreferenced.png", site)
+
+    def test_dry_run(self):
+        site = self.mkdocsSiteFiles(
+            {"plugins": [{"awesome-pages": {"filter_dry_run": True}}], "nav": None},
+            [
+                (
+                    "section",
+                    [
+                        self.pagesFile(nav=["index.md"], filter_not_referenced=True),
+                        ("index.md", ""),
+                        ("unreferenced.png", "png"),
+                    ],
+                ),
+            ],
+        )
+
+        self.assertIn("section/unreferenced.png", site)
+
+    def test_manifest(self):
+        with tempfile.TemporaryDirectory() as manifest_directory:
+            manifest_path = os.path.join(manifest_directory, "manifest.json")
+            site = self.mkdocsSiteFiles(
+                {"plugins": [{"awesome-pages": {"filter_manifest": manifest_path}}], "nav": None},
+                [
+                    (
+                        "section",
+                        [
+                            self.pagesFile(nav=["index.md"], filter_not_referenced=True),
+                            ("index.md", "![Referenced](referenced.png)"),
+                            ("referenced.png", "png"),
+                            ("unreferenced.png", "1234"),
+                            ("img", [("unreferenced.png", "12345")]),
+                        ],
+                    ),
+                ],
+            )
+            manifest = read_manifest(manifest_path)
+
+        self.assertEqual(manifest["files"], ["section/img/unreferenced.png", "section/unreferenced.png"])
+        self.assertEqual(manifest["total_bytes"], 9)
+        self.assertNotIn("section/unreferenced.png", site)
+
+    def test_unreferenced_files_not_copied(self):
+        with mock.patch("mkdocs_awesome_pages_plugin.plugin.remove_files") as remove_files:
+            site = self._site()
+
+        self.assertNotIn("section/img/unreferenced.png", site)
+        self.assertNotIn("section/files/other.zip", site)
+        self.assertEqual(remove_files.call_args[0][0], set())
@@ -131,3 +131,51 @@ class TestOrder(E2ETestCase):
                 ("2", [("1", "/2/1"), ("3", "/2/3"), ("2", "/2/2")]),
             ],
         )
+
+    def test_order_by_natural(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                "page1.md",
+                "page10.md",
+                "page2.md",
+                self.pagesFile(order_by="natural"),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("Page1", "/page1"), ("Page2", "/page2"), ("Page10", "/page10")],
+        )
+
+    def test_order_by_title(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("1.md", "# C\n"),
+                ("2.md", "---\ntitle: A\n---\n"),
+                ("3", ["a.md", self.pagesFile(title="B")]),
+                self.pagesFile(order_by="title"),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("A", "/2"), ("B", [("A", "/3/a")]), ("C", "/1")],
+        )
+
+    def test_order_by_date(self):
+        navigation = self.mkdocs(
+            self.config,
+            [
+                ("first.md", "---\ndate: 2020-01-01\n---\n"),
+                ("second.md", "---\ndate: 2021-06-01\n---\n"),
+                ("undated.md", "# Undated\n"),
+                self.pagesFile(order="desc", order_by="date"),
+            ],
+        )
+
+        self.assertEqual(
+            navigation,
+            [("Second", "/second"), ("First", "/first"), ("Undated", "/undated")],
+        )
@@ -1,5 +1,5 @@
 import os
-from typing import List, Union, Optional
+from typing import Iterable, List, Union, Optional
 from unittest import TestCase, mock
 
 from mkdocs.structure.files import File
@@ -20,6 +20,8 @@ from ...options import Options
 class NavigationMetaMock:
     def __init__(self):
         self.sections = {}
+        self.paths = {}
+        self.signatures = {}
         self.root = Meta()
 
 
@@ -55,7 +57,12 @@ class NavigationTestCase(TestCase):
         return section
 
     def createAwesomeNavigation(
-        self, items: List[NavigationItem], *, collapse_single_pages: bool = False, strict: bool = True
+        self,
+        items: List[NavigationItem],
+        *,
+        collapse_single_pages: bool = False,
+        strict: bool = True,
+        deleted_files: Iterable[str] = (),
     ) -> AwesomeNavigation:
 
         children = []
@@ -78,6 +85,7 @@ class NavigationTestCase(TestCase):
             ),
             docs_dir="",
             explicit_sections=set(),
+            deleted_files=deleted_files,
         )
 
     def assertNavigationEqual(self, actual: List[NavigationItem], expected: List[NavigationItem]):
@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 from unittest import TestCase
 
@@ -78,6 +79,18 @@ class TestMeta(NavigationTestCase):
         self.assertMeta(meta.sections[section], path="section/.pages")
         self.assertMeta(meta.root, path=".pages")
 
+    def test_paths(self):
+        page = self.page("Page", "section/page.md")
+        section = self.section("Section", [page])
+        explicit_section = self.section("Explicit", [])
+        meta = NavigationMeta(
+            [section, explicit_section], self.options, docs_dir="", explicit_sections={explicit_section}
+        )
+
+        self.assertEqual(meta.paths[id(page)], (page.file.abs_src_path, "page.md"))
+        self.assertEqual(meta.paths[id(section)], (os.path.dirname(page.file.abs_src_path), "section"))
+        self.assertEqual(meta.paths[id(explicit_section)], (None, None))
+
     def test_multiple_sections(self):
         b = self.section("B", [self.page("1", "a/b/1.md")])
         a = self.section("A", [b])
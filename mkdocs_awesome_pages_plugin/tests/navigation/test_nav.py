@@ -389,6 +389,16 @@ class TestNav(NavigationTestCase):
                 strict=False,
             )
 
+    def test_not_found_deleted(self):
+        items = [self.page("1"), Meta(path=".pages", nav=[MetaNavItem("1.md"), MetaNavItem("2.md")])]
+
+        navigation = self.createAwesomeNavigation(items, deleted_files=["2.md"])
+        self.assertNavigationEqual(navigation.items, [self.page("1")])
+
+        # the deleted files of a build do not affect the next one
+        with self.assertRaises(NavEntryNotFound):
+            self.createAwesomeNavigation(items)
+
     def test_virtual_section(self):
         navigation = self.createAwesomeNavigation(
             [
@@ -424,3 +434,29 @@ class TestNav(NavigationTestCase):
             ],
         )
         self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_virtual_section_rest(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("1"),
+                self.page("2a"),
+                self.page("2b"),
+                self.page("3"),
+                Meta(
+                    nav=[
+                        MetaNavItem("3.md"),
+                        MetaNavItem([MetaNavItem("1.md"), MetaNavRestItem("... | 2*")], "Nested"),
+                        MetaNavRestItem("..."),
+                    ]
+                ),
+            ]
+        )
+
+        self.assertNavigationEqual(
+            navigation.items,
+            [
+                self.page("3"),
+                self.section("Nested", [self.page("1"), self.page("2a"), self.page("2b")]),
+            ],
+        )
+        self.assertValidNavigation(navigation.to_mkdocs())
@@ -1,5 +1,12 @@
+import os
+import tempfile
+from typing import Optional
+from unittest import mock
+
 from .base import NavigationTestCase
+from ...frontmatter import read_header
 from ...meta import Meta, MetaNavItem, MetaNavRestItem
+from ...utils import modification_times
 
 
 class TestOrder(NavigationTestCase):
@@ -135,3 +142,203 @@ class TestOrder(NavigationTestCase):
             [self.page("1"), self.page("4"), self.page("3"), self.page("2")],
         )
         self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_natural(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("page10"),
+                self.page("page2"),
+                self.page("Page1"),
+                self.section("section11", [self.page("a", "section11/a.md")], "section11"),
+                Meta(order_by=Meta.ORDER_BY_NATURAL),
+            ]
+        )
+
+        self.assertNavigationEqual(
+            navigation.items,
+            [
+                self.page("Page1"),
+                self.page("page2"),
+                self.page("page10"),
+                self.section("section11", [self.page("a", "section11/a.md")], "section11"),
+            ],
+        )
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_natural_desc(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("page10"),
+                self.page("page2"),
+                self.page("page1"),
+                Meta(order=Meta.ORDER_DESC, order_by=Meta.ORDER_BY_NATURAL),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("page10"), self.page("page2"), self.page("page1")])
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_filename(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("page2"),
+                self.page("page10"),
+                Meta(order_by=Meta.ORDER_BY_FILENAME),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("page10"), self.page("page2")])
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_title(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("C", "1.md"),
+                self.page("A", "2.md"),
+                self.section("Z", [self.page("a", "3/a.md"), Meta(title="B", path="3/.pages")]),
+                Meta(order_by=Meta.ORDER_BY_TITLE),
+            ]
+        )
+
+        self.assertNavigationEqual(
+            navigation.items,
+            [
+                self.page("A", "2.md"),
+                self.section("B", [self.page("a", "3/a.md")]),
+                self.page("C", "1.md"),
+            ],
+        )
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_title_desc(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("A", "1.md"),
+                self.page("C", "2.md"),
+                self.page("B", "3.md"),
+                Meta(order=Meta.ORDER_DESC, order_by=Meta.ORDER_BY_TITLE),
+            ]
+        )
+
+        self.assertNavigationEqual(
+            navigation.items, [self.page("C", "2.md"), self.page("B", "3.md"), self.page("A", "1.md")]
+        )
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_locale(self):
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("b"),
+                self.page("c"),
+                self.page("a"),
+                Meta(order=Meta.ORDER_LOCALE),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("a"), self.page("b"), self.page("c")])
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+
+class TestOrderByFile(NavigationTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.docs_dir = directory.name
+
+    def file(self, path: str, contents: str = "", mtime: Optional[int] = None):
+        path = os.path.join(self.docs_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(contents)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_mtime(self):
+        self.file("1.md", mtime=300)
+        self.file("2.md", mtime=100)
+        self.file("3.md", mtime=200)
+
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("1", "1.md", self.docs_dir),
+                self.page("2", "2.md", self.docs_dir),
+                self.page("3", "3.md", self.docs_dir),
+                Meta(order_by=Meta.ORDER_BY_MTIME),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("2"), self.page("3"), self.page("1")])
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_mtime_desc(self):
+        self.file("1.md", mtime=300)
+        self.file("2.md", mtime=100)
+        self.file("3.md", mtime=200)
+
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("1", "1.md", self.docs_dir),
+                self.page("2", "2.md", self.docs_dir),
+                self.page("3", "3.md", self.docs_dir),
+                Meta(order=Meta.ORDER_DESC, order_by=Meta.ORDER_BY_MTIME),
+            ]
+        )
+
+        self.assertNavigationEqual(navigation.items, [self.page("1"), self.page("3"), self.page("2")])
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_mtime_stats_directory_once(self):
+        for index in range(3):
+            self.file("{}.md".format(index))
+
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.modification_times", wraps=modification_times) as times:
+            self.createAwesomeNavigation(
+                [self.page(str(index), "{}.md".format(index), self.docs_dir) for index in range(3)]
+                + [Meta(order_by=Meta.ORDER_BY_MTIME)]
+            )
+
+        times.assert_called_once_with(self.docs_dir)
+
+    def test_date(self):
+        self.file("1.md", "---\ndate: 2021-03-01\n---\n")
+        self.file("2.md", "---\ndate: 2020-12-31 23:00:00\n---\n")
+        self.file("3.md", "# No date\n")
+        self.file("a/1.md", "---\ndate: '2021-02-01'\n---\n")
+        self.file("a/2.md", "---\ndate: 2019-01-01\n---\n")
+
+        navigation = self.createAwesomeNavigation(
+            [
+                self.page("1", "1.md", self.docs_dir),
+                self.page("2", "2.md", self.docs_dir),
+                self.page("3", "3.md", self.docs_dir),
+                self.section("a", [self.page("a1", "a/1.md", self.docs_dir), self.page("a2", "a/2.md", self.docs_dir)]),
+                Meta(order=Meta.ORDER_DESC, order_by=Meta.ORDER_BY_DATE),
+            ]
+        )
+
+        self.assertNavigationEqual(
+            navigation.items,
+            [
+                self.page("1"),
+                self.section("a", [self.page("a1", "a/1.md"), self.page("a2", "a/2.md")]),
+                self.page("2"),
+                self.page("3"),
+            ],
+        )
+        self.assertValidNavigation(navigation.to_mkdocs())
+
+    def test_date_reads_front_matter_once(self):
+        self.file("1.md", "---\ndate: 2021-03-01\n---\n")
+        self.file("a/1.md", "---\ndate: 2021-02-01\n---\n")
+
+        with mock.patch("mkdocs_awesome_pages_plugin.navigation.read_header", wraps=read_header) as header:
+            self.createAwesomeNavigation(
+                [
+                    self.page("1", "1.md", self.docs_dir),
+                    self.section("a", [self.page("a1", "a/1.md", self.docs_dir), Meta(order_by=Meta.ORDER_BY_DATE)]),
+                    Meta(order_by=Meta.ORDER_BY_DATE),
+                ]
+            )
+
+        self.assertEqual(header.call_count, 2)
@@ -0,0 +1,246 @@
+import contextlib
+import os
+import tempfile
+from typing import Iterator, List, Union
+from unittest import TestCase, mock
+
+from mkdocs.structure.files import File
+from mkdocs.structure.nav import Link, Section
+from mkdocs.structure.pages import Page
+
+from ...cache import MetaCache
+from ...navigation import AwesomeNavigation, NavigationItem, ProcessedSections, VirtualSection, iter_by_type
+from ...options import Options
+
+
+class TestProcessedSections(TestCase):
+    """Rebuilds of the navigation from fresh MkDocs objects, as `mkdocs serve` does"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.docs_dir = directory.name
+
+        ProcessedSections.clear()
+        MetaCache.clear()
+        self.addCleanup(ProcessedSections.clear)
+        self.addCleanup(MetaCache.clear)
+
+        self.options = Options(filename=".pages", collapse_single_pages=False, strict=True)
+        self.mtime = 1000
+
+        self.file("index.md")
+        self.file("a/1.md")
+        self.file("a/2.md")
+        self.file(
+            "a/.pages", "title: Section A\nnav:\n  - 2.md\n  - Virtual:\n    - 1.md\n  - Link: https://example.com\n"
+        )
+        self.file("b/1.md")
+        self.file("b/c/1.md")
+        self.file("b/c/.pages", "collapse: true\n")
+        self.file("d/1.md")
+        self.file("d/.pages", "hide: true\n")
+
+    def file(self, path: str, contents: str = ""):
+        path = os.path.join(self.docs_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(contents)
+        # distinct modification times, writes within the timestamp resolution would look unchanged otherwise
+        self.mtime += 1
+        os.utime(path, (self.mtime, self.mtime))
+
+    def items(self, directory: str = "") -> List[NavigationItem]:
+        """Creates the navigation items MkDocs would create for the docs directory"""
+        items = []
+        for name in sorted(os.listdir(os.path.join(self.docs_dir, directory))):
+            path = os.path.join(directory, name)
+            if os.path.isdir(os.path.join(self.docs_dir, path)):
+                items.append(Section(name.title(), self.items(path)))
+            elif name.endswith(".md"):
+                items.append(Page(None, File(path, self.docs_dir, "", False), {}))
+        return items
+
+    def build(self) -> AwesomeNavigation:
+        return AwesomeNavigation(self.items(), self.options, self.docs_dir, set())
+
+    def serialize(self, items: List[NavigationItem]) -> List[Union[tuple, list]]:
+        result = []
+        for item in items:
+            if isinstance(item, Section):
+                result.append((type(item).__name__, item.title, self.serialize(item.children)))
+            elif isinstance(item, Page):
+                result.append(("Page", item.file.src_path, item.title))
+            else:
+                result.append(("Link", item.title, item.url))
+        return result
+
+    @contextlib.contextmanager
+    def processed(self) -> Iterator[List[str]]:
+        """Collects the titles of the sections that are processed instead of replayed"""
+        titles = []
+        original = AwesomeNavigation._process_section_contents
+
+        def process(navigation, section, collapse_recursive):
+            titles.append(section.title)
+            return original(navigation, section, collapse_recursive)
+
+        with mock.patch.object(AwesomeNavigation, "_process_section_contents", autospec=True, side_effect=process):
+            yield titles
+
+    def test_same_result(self):
+        expected = self.serialize(self.build().items)
+
+        with self.processed() as processed:
+            navigation = self.build()
+
+        self.assertEqual(self.serialize(navigation.items), expected)
+        self.assertEqual(processed, [])
+
+    def test_expected_navigation(self):
+        self.build()
+        navigation = self.build()
+
+        self.assertEqual(
+            self.serialize(navigation.items),
+            [
+                (
+                    "Section",
+                    "Section A",
+                    [
+                        ("Page", os.path.join("a", "2.md"), None),
+                        ("VirtualSection", "Virtual", [("Page", os.path.join("a", "1.md"), None)]),
+                        ("Link", "Link", "https://example.com"),
+                    ],
+                ),
+                (
+                    "Section",
+                    "B",
+                    [("Page", os.path.join("b", "1.md"), None), ("Page", os.path.join("b", "c", "1.md"), None)],
+                ),
+                ("Page", "index.md", None),
+            ],
+        )
+
+    def test_replays_onto_new_objects(self):
+        self.build()
+        items = self.items()
+        pages = {id(page) for page in iter_by_type(items, Page)}
+
+        navigation = AwesomeNavigation(items, self.options, self.docs_dir, set())
+        mkdocs_navigation = navigation.to_mkdocs()
+
+        self.assertEqual(len(mkdocs_navigation.pages), 5)
+        for page in mkdocs_navigation.pages:
+            self.assertIn(id(page), pages)
+            self.assertIs(page.file.page, page)
+
+    def test_changed_meta_file(self):
+        self.build()
+        self.file("b/c/.pages", "title: C\n")
+
+        with self.processed() as processed:
+            navigation = self.build()
+
+        self.assertEqual(
+            self.serialize(navigation.items)[1],
+            (
+                "Section",
+                "B",
+                [
+                    ("Page", os.path.join("b", "1.md"), None),
+                    ("Section", "C", [("Page", os.path.join("b", "c", "1.md"), None)]),
+                ],
+            ),
+        )
+        # the changed section and its ancestors only
+        self.assertEqual(processed, ["B", "C"])
+
+    def test_added_file(self):
+        self.build()
+        self.file("a/3.md")
+
+        with self.processed() as processed:
+            navigation = self.build()
+
+        self.assertEqual(
+            self.serialize(navigation.items)[0][2][0:2],
+            [
+                ("Page", os.path.join("a", "2.md"), None),
+                ("VirtualSection", "Virtual", [("Page", os.path.join("a", "1.md"), None)]),
+            ],
+        )
+        self.assertEqual(processed, ["A"])
+
+    def test_removed_file(self):
+        self.build()
+        os.remove(os.path.join(self.docs_dir, "b", "1.md"))
+
+        navigation = self.build()
+
+        self.assertEqual(
+            self.serialize(navigation.items)[1], ("Section", "B", [("Page", os.path.join("b", "c", "1.md"), None)])
+        )
+
+    def test_retitled_by_parent(self):
+        self.file("e/f/1.md")
+        self.file("e/f/2.md")
+        self.file("e/.pages", "nav:\n  - Old Title: f\n")
+        self.build()
+        self.file("e/.pages", "nav:\n  - New Title: f\n")
+
+        with self.processed() as processed:
+            navigation = self.build()
+        ProcessedSections.clear()
+        expected = self.build()
+
+        self.assertEqual(self.serialize(navigation.items), self.serialize(expected.items))
+        self.assertEqual(navigation.items[2].children[0].title, "New Title")
+        self.assertEqual(processed, ["E"])
+
+    def test_retitled_by_replayed_parent(self):
+        self.file("e/f/1.md")
+        self.file("e/f/2.md")
+        self.file("e/.pages", "nav:\n  - Title: f\n")
+        self.build()
+
+        with self.processed() as processed:
+            navigation = self.build()
+
+        self.assertEqual(navigation.items[2].children[0].title, "Title")
+        self.assertEqual(processed, [])
+
+    def test_previous_builds_dropped(self):
+        self.build()
+        templates = len(ProcessedSections._templates)
+
+        self.file("b/c/.pages", "title: C\n")
+        self.build()
+
+        self.assertEqual(len(ProcessedSections._templates), templates)
+        self.assertEqual(len(ProcessedSections._keys), templates)
+
+    def test_changed_options(self):
+        self.build()
+        self.options = Options(filename=".pages", collapse_single_pages=True, strict=True)
+
+        with self.processed() as processed:
+            self.build()
+
+        self.assertNotEqual(processed, [])
+
+    def test_order_by_file_contents_not_memoized(self):
+        self.file("b/.pages", "order_by: date\n")
+        self.build()
+
+        with self.processed() as processed:
+            self.build()
+
+        self.assertEqual(processed, ["B"])
+
+    def test_virtual_section_type(self):
+        self.build()
+        navigation = self.build()
+
+        self.assertIsInstance(navigation.items[0].children[1], VirtualSection)
+        self.assertIsInstance(navigation.items[0].children[2], Link)
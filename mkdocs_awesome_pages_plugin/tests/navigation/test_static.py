@@ -1,9 +1,12 @@
+import sys
 from unittest import TestCase
 
-from mkdocs.structure.nav import Section
+from mkdocs.structure.files import File
+from mkdocs.structure.nav import Link, Section, _add_previous_and_next_links
+from mkdocs.structure.pages import Page
 
 from ...meta import Meta
-from ...navigation import AwesomeNavigation
+from ...navigation import AwesomeNavigation, get_by_type, iter_by_type
 
 
 class TestSetTitle(TestCase):
@@ -73,3 +76,87 @@ class TestCollapse(TestCase):
         self.assertEqual(AwesomeNavigation._collapse(section, True, False), section)
         self.assertEqual(AwesomeNavigation._collapse(section, True, True), section)
         self.assertEqual(AwesomeNavigation._collapse(section, False, True), section)
+
+
+class TestGetByType(TestCase):
+    def setUp(self):
+        self.page1 = Page("1", File("1.md", "", "", False), {})
+        self.page2 = Page("2", File("a/2.md", "", "", False), {})
+        self.page3 = Page("3", File("a/b/3.md", "", "", False), {})
+        self.link = Link("Link", "https://example.com")
+        self.b = Section("B", [self.page3])
+        self.a = Section("A", [self.page2, self.b, self.link])
+        self.empty = Section("Empty", [])
+        self.nav = [self.page1, self.a, self.empty]
+
+    def test_pages(self):
+        self.assertEqual(get_by_type(self.nav, Page), [self.page1, self.page2, self.page3])
+
+    def test_sections(self):
+        self.assertEqual(get_by_type(self.nav, Section), [self.a, self.b, self.empty])
+
+    def test_depth_first_order(self):
+        self.assertEqual(
+            list(iter_by_type(self.nav, (Page, Section, Link))),
+            [self.page1, self.a, self.page2, self.b, self.page3, self.link, self.empty],
+        )
+
+    def test_deeply_nested(self):
+        page = Page("Page", File("page.md", "", "", False), {})
+        nav = [page]
+        for _ in range(sys.getrecursionlimit() * 2):
+            nav = [Section("Section", nav)]
+
+        self.assertEqual(get_by_type(nav, Page), [page])
+
+
+class TestLinkItems(TestCase):
+    def setUp(self):
+        self.page1 = Page("1", File("1.md", "", "", False), {})
+        self.page2 = Page("2", File("a/2.md", "", "", False), {})
+        self.page3 = Page("3", File("a/b/3.md", "", "", False), {})
+        self.link = Link("Link", "https://example.com")
+        self.b = Section("B", [self.page3])
+        self.a = Section("A", [self.page2, self.b, self.link])
+
+    def test_pages(self):
+        self.assertEqual(AwesomeNavigation._link_items([self.page1, self.a]), [self.page1, self.page2, self.page3])
+
+    def test_previous_next(self):
+        AwesomeNavigation._link_items([self.page1, self.a])
+
+        self.assertIsNone(self.page1.previous_page)
+        self.assertEqual(self.page1.next_page, self.page2)
+        self.assertEqual(self.page2.previous_page, self.page1)
+        self.assertEqual(self.page2.next_page, self.page3)
+        self.assertEqual(self.page3.previous_page, self.page2)
+        self.assertIsNone(self.page3.next_page)
+
+    def test_duplicate_page(self):
+        pages = AwesomeNavigation._link_items([self.page1, self.page2, self.page2])
+
+        self.assertEqual(pages, [self.page1, self.page2, self.page2])
+        self.assertEqual(self.page1.next_page, self.page2)
+        self.assertIsNone(self.page2.next_page)
+
+    def test_same_links_as_mkdocs(self):
+        items = [self.page1, self.a, self.page3, Section("C", [self.page1])]
+        AwesomeNavigation._link_items(items)
+        actual = [(id(page.previous_page), id(page.next_page)) for page in get_by_type(items, Page)]
+
+        _add_previous_and_next_links(get_by_type(items, Page))
+        expected = [(id(page.previous_page), id(page.next_page)) for page in get_by_type(items, Page)]
+
+        self.assertEqual(actual, expected)
+
+    def test_parents(self):
+        # stale parent, e.g. of a page moved to the top level by collapsing its section
+        self.page1.parent = self.a
+        AwesomeNavigation._link_items([self.page1, self.a])
+
+        self.assertIsNone(self.page1.parent)
+        self.assertIsNone(self.a.parent)
+        self.assertEqual(self.page2.parent, self.a)
+        self.assertEqual(self.b.parent, self.a)
+        self.assertEqual(self.link.parent, self.a)
+        self.assertEqual(self.page3.parent, self.b)
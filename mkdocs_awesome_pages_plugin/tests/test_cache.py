@@ -0,0 +1,197 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from ..cache import MetaCache, MetaIndex, MetaIndexNotSaved
+from ..meta import Meta, MetaNavItem, MetaNavRestItem
+
+
+class TestMetaCache(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+
+        MetaCache.clear()
+        self.addCleanup(MetaCache.clear)
+
+        patcher = mock.patch.object(Meta, "load_from", wraps=Meta.load_from)
+        self.addCleanup(patcher.stop)
+        self.load_from = patcher.start()
+
+    def write(self, contents: str, filename: str = ".pages"):
+        path = os.path.join(self.directory, filename)
+        with open(path, "w") as file:
+            file.write(contents)
+        return path
+
+    def test_loads_once_per_directory(self):
+        path = self.write("title: A\n")
+
+        cache = MetaCache(".pages")
+        first = cache.get(self.directory)
+        second = cache.get(self.directory)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.title, "A")
+        self.load_from.assert_called_once_with(path, None)
+
+    def test_missing_file(self):
+        cache = MetaCache(".pages")
+        meta = cache.get(self.directory)
+
+        self.assertEqual(meta.path, os.path.join(self.directory, ".pages"))
+        self.assertIsNone(meta.nav)
+        self.assertIs(cache.get(self.directory), meta)
+        self.load_from.assert_not_called()
+
+    def test_custom_filename(self):
+        self.write("title: A\n", ".index")
+
+        self.assertEqual(MetaCache(".index").get(self.directory).title, "A")
+
+    def test_no_directory(self):
+        meta = MetaCache(".pages").get(None)
+
+        self.assertIsNone(meta.path)
+        self.assertIsNone(meta.title)
+
+    def test_reused_across_builds(self):
+        self.write("title: A\n")
+
+        first = MetaCache(".pages").get(self.directory)
+        second = MetaCache(".pages").get(self.directory)
+
+        self.assertIs(first, second)
+        self.load_from.assert_called_once()
+
+    def test_invalidated_on_change(self):
+        self.write("title: A\n")
+        first = MetaCache(".pages").get(self.directory)
+
+        self.write("title: Changed\n")
+        second = MetaCache(".pages").get(self.directory)
+
+        self.assertEqual(first.title, "A")
+        self.assertEqual(second.title, "Changed")
+        self.assertEqual(self.load_from.call_count, 2)
+
+    def test_invalidated_on_removal(self):
+        path = self.write("title: A\n")
+        MetaCache(".pages").get(self.directory)
+
+        os.remove(path)
+        meta = MetaCache(".pages").get(self.directory)
+
+        self.assertIsNone(meta.title)
+        self.assertEqual(meta.path, path)
+
+    def test_prune(self):
+        self.write("title: A\n")
+        other = tempfile.TemporaryDirectory()
+        self.addCleanup(other.cleanup)
+        with open(os.path.join(other.name, ".pages"), "w") as file:
+            file.write("title: B\n")
+
+        MetaCache(".pages").get(other.name)
+        cache = MetaCache(".pages")
+        first = cache.get(self.directory)
+        cache.prune()
+
+        self.assertIs(MetaCache(".pages").get(self.directory), first)
+        MetaCache(".pages").get(other.name)
+        self.assertEqual(self.load_from.call_count, 3)
+
+
+class TestMetaIndex(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+        self.cache_dir = os.path.join(self.directory, ".cache", "awesome-pages")
+        self.pages = os.path.join(self.directory, ".pages")
+
+        with open(self.pages, "w") as file:
+            file.write("title: Section\nnav:\n  - b.md\n  - ...\n")
+
+    def test_roundtrip(self):
+        index = MetaIndex(self.cache_dir, self.directory)
+        Meta.load_from(self.pages, index)
+        index.save()
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.safe_load") as safe_load:
+            meta = Meta.load_from(self.pages, MetaIndex(self.cache_dir, self.directory))
+
+        safe_load.assert_not_called()
+        self.assertEqual(meta.title, "Section")
+        self.assertEqual(meta.nav, [MetaNavItem("b.md"), MetaNavRestItem("...")])
+        self.assertEqual(meta.path, self.pages)
+
+    def test_changed_contents(self):
+        index = MetaIndex(self.cache_dir, self.directory)
+        Meta.load_from(self.pages, index)
+        index.save()
+
+        with open(self.pages, "w") as file:
+            file.write("title: Changed\n")
+
+        meta = Meta.load_from(self.pages, MetaIndex(self.cache_dir, self.directory))
+        self.assertEqual(meta.title, "Changed")
+        self.assertIsNone(meta.nav)
+
+    def test_invalid_contents_not_indexed(self):
+        with open(self.pages, "w") as file:
+            file.write("title:\n  - Section\n")
+
+        index = MetaIndex(self.cache_dir, self.directory)
+        with self.assertRaises(TypeError):
+            Meta.load_from(self.pages, index)
+        index.save()
+
+        self.assertFalse(os.path.exists(index.path))
+
+    def test_corrupt_index(self):
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, MetaIndex.FILENAME), "w") as file:
+            file.write("{not json")
+
+        meta = Meta.load_from(self.pages, MetaIndex(self.cache_dir, self.directory))
+        self.assertEqual(meta.title, "Section")
+
+    def test_moved_checkout(self):
+        index = MetaIndex(self.cache_dir, self.directory)
+        Meta.load_from(self.pages, index)
+        index.save()
+
+        moved = tempfile.TemporaryDirectory()
+        self.addCleanup(moved.cleanup)
+        directory = os.path.join(moved.name, "checkout")
+        shutil.copytree(self.directory, directory)
+        pages = os.path.join(directory, ".pages")
+
+        with mock.patch("mkdocs_awesome_pages_plugin.meta.yaml.safe_load") as safe_load:
+            meta = Meta.load_from(pages, MetaIndex(os.path.join(directory, ".cache", "awesome-pages"), directory))
+
+        safe_load.assert_not_called()
+        self.assertEqual(meta.title, "Section")
+        self.assertEqual(meta.path, pages)
+
+    def test_unwritable_cache_dir(self):
+        with open(os.path.join(self.directory, "file"), "w"):
+            pass
+        index = MetaIndex(os.path.join(self.directory, "file", "awesome-pages"), self.directory)
+        Meta.load_from(self.pages, index)
+
+        with self.assertWarns(MetaIndexNotSaved):
+            index.save()
+
+    def test_removed_files_dropped(self):
+        index = MetaIndex(self.cache_dir, self.directory)
+        Meta.load_from(self.pages, index)
+        os.remove(self.pages)
+        index.save()
+
+        with open(index.path) as file:
+            self.assertEqual(json.load(file)["entries"], {})
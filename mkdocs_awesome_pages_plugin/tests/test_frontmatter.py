@@ -0,0 +1,113 @@
+import datetime
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from ..frontmatter import parse_date, read_header, title_from_filename
+
+
+class TestReadHeader(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "page.md")
+
+    def write(self, contents: str):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(contents)
+
+    def test_heading(self):
+        self.write("\n# Page Title\n\n# Other\n")
+        header = read_header(self.path)
+
+        self.assertEqual(header.title, "Page Title")
+        self.assertEqual(header.meta, {})
+
+    def test_setext_heading(self):
+        self.write("Page Title\n==========\n\n# Other\n")
+
+        self.assertEqual(read_header(self.path).title, "Page Title")
+
+    def test_heading_after_content(self):
+        self.write("Intro\n\n# Page Title\n")
+
+        self.assertIsNone(read_header(self.path).title)
+
+    def test_reads_first_block_only(self):
+        with mock.patch("builtins.open", mock.mock_open(read_data="Intro\n\n" + "Text\n" * 1000)) as open_mock:
+            read_header(self.path)
+
+        self.assertLessEqual(open_mock.return_value.readline.call_count, 2)
+
+    def test_heading_closing_hashes(self):
+        self.write("# Page Title ##\n")
+
+        self.assertEqual(read_header(self.path).title, "Page Title")
+
+    def test_front_matter(self):
+        self.write("---\ndate: 2021-03-04\nauthor: me\n---\n\n# Page Title\n")
+        header = read_header(self.path)
+
+        self.assertEqual(header.title, "Page Title")
+        self.assertEqual(header.meta["author"], "me")
+
+    def test_front_matter_title(self):
+        self.write("---\ntitle: Front Matter Title\n---\n\n# Page Title\n")
+
+        self.assertEqual(read_header(self.path).title, "Front Matter Title")
+
+    def test_invalid_front_matter(self):
+        self.write("---\n: [\n---\n# Page Title\n")
+        header = read_header(self.path)
+
+        self.assertEqual(header.meta, {})
+        self.assertEqual(header.title, "Page Title")
+
+    def test_without_title(self):
+        self.write("---\nauthor: me\n---\n# Page Title\n")
+        header = read_header(self.path, title=False)
+
+        self.assertIsNone(header.title)
+        self.assertEqual(header.meta, {"author": "me"})
+
+    def test_no_title(self):
+        self.write("Some text\n")
+
+        self.assertIsNone(read_header(self.path).title)
+
+    def test_missing_file(self):
+        header = read_header(self.path)
+
+        self.assertEqual(header.meta, {})
+        self.assertIsNone(header.title)
+
+
+class TestTitleFromFilename(TestCase):
+    def test_lowercase(self):
+        self.assertEqual(title_from_filename("docs/getting-started_guide.md"), "Getting started guide")
+
+    def test_mixed_case(self):
+        self.assertEqual(title_from_filename("docs/API-Reference.md"), "API Reference")
+
+
+class TestParseDate(TestCase):
+    def test_date(self):
+        self.assertEqual(parse_date(datetime.date(2021, 3, 4)), datetime.datetime(2021, 3, 4))
+
+    def test_datetime(self):
+        self.assertEqual(parse_date(datetime.datetime(2021, 3, 4, 10, 30)), datetime.datetime(2021, 3, 4, 10, 30))
+
+    def test_aware_datetime(self):
+        value = datetime.datetime(2021, 3, 4, 10, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+
+        self.assertEqual(parse_date(value), datetime.datetime(2021, 3, 4, 8, 30))
+
+    def test_string(self):
+        self.assertEqual(parse_date("2021-03-04"), datetime.datetime(2021, 3, 4))
+        self.assertEqual(parse_date("2021-03-04T10:30:00Z"), datetime.datetime(2021, 3, 4, 10, 30))
+
+    def test_invalid(self):
+        self.assertIsNone(parse_date("yesterday"))
+        self.assertIsNone(parse_date("[2021"))
+        self.assertIsNone(parse_date(2021))
+        self.assertIsNone(parse_date(None))
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from ..links import extract_links
+
+
+class TestExtractLinks(TestCase):
+    def test_anchor_and_image(self):
+        html = '<p><a href="file.zip">Download</a> <img alt="a" src="img/a.png" /></p>'
+        self.assertEqual(extract_links(html), ["file.zip", "img/a.png"])
+
+    def test_attribute_order(self):
+        html = '<img class="x" title="a &quot;b&quot;" src="a.png" width="10">'
+        self.assertEqual(extract_links(html), ["a.png"])
+
+    def test_srcset(self):
+        html = '<img srcset="a-1x.png 1x, a-2x.png 2x,b.png">'
+        self.assertEqual(extract_links(html), ["a-1x.png", "a-2x.png", "b.png"])
+
+    def test_media_elements(self):
+        html = (
+            '<video src="movie.mp4" poster="poster.jpg">'
+            '<source src="movie.webm" type="video/webm">'
+            '<source srcset="movie-small.webm 480w">'
+            "</video>"
+            '<link rel="stylesheet" href="extra.css">'
+        )
+        self.assertEqual(
+            extract_links(html),
+            ["movie.mp4", "poster.jpg", "movie.webm", "movie-small.webm", "extra.css"],
+        )
+
+    def test_external_links_skipped(self):
+        html = (
+            '<a href="https://example.com/a.png">x</a>'
+            '<a href="//example.com/b.png">x</a>'
+            '<a href="mailto:someone@example.com">x</a>'
+            '<img src="data:image/png;base64,AAAA">'
+            '<a href="#anchor">x</a>'
+            '<a href="">x</a>'
+        )
+        self.assertEqual(extract_links(html), [])
+
+    def test_query_and_fragment_stripped(self):
+        html = '<a href="doc.pdf?v=2#page=3">x</a>'
+        self.assertEqual(extract_links(html), ["doc.pdf"])
+
+    def test_unquoted(self):
+        html = '<a href="my%20file.pdf">x</a> <a href="a&amp;b.pdf">y</a>'
+        self.assertEqual(extract_links(html), ["my file.pdf", "a&b.pdf"])
+
+    def test_long_attribute_lists(self):
+        attributes = " ".join('data-x{}="{}"'.format(i, '\\"' * 50) for i in range(200))
+        html = '<img {} src="a.png">'.format(attributes) * 50
+        self.assertEqual(extract_links(html), ["a.png"] * 50)
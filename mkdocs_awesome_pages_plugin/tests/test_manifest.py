@@ -0,0 +1,40 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ..manifest import main, read_manifest, write_manifest
+
+
+class TestManifest(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.site_dir = os.path.join(temp_directory.name, "site")
+        self.manifest_path = os.path.join(temp_directory.name, "out", "manifest.json")
+
+        self.files = []
+        for relative_path, contents in [("b/c.png", "123"), ("a.png", "12")]:
+            path = os.path.join(self.site_dir, *relative_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                file.write(contents)
+            self.files.append(path)
+
+    def test_write_and_read(self):
+        write_manifest(self.manifest_path, self.site_dir, {file: os.path.getsize(file) for file in self.files})
+
+        manifest = read_manifest(self.manifest_path)
+        self.assertEqual(manifest["site_dir"], self.site_dir)
+        self.assertEqual(manifest["files"], ["a.png", "b/c.png"])
+        self.assertEqual(manifest["total_bytes"], 5)
+
+    def test_main(self):
+        write_manifest(self.manifest_path, self.site_dir, {file: os.path.getsize(file) for file in self.files})
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main([self.manifest_path, "--prefix", "/"])
+
+        self.assertEqual(output.getvalue(), "/a.png\n/b/c.png\n")
@@ -1,6 +1,16 @@
+import os
+import re
 from unittest import TestCase, mock
 
-from ..meta import Meta, DuplicateRestItemError, MetaNavItem, MetaNavRestItem
+from ..meta import (
+    Meta,
+    DuplicateRestItemError,
+    EnvConditions,
+    MetaNavEnvCondition,
+    MetaNavItem,
+    MetaNavRestItem,
+    RestItemList,
+)
 from .file_mock import FileMock
 
 
@@ -99,6 +109,42 @@ class TestLoadFrom(TestCase):
         meta = Meta.load_from(".pages")
         self.assertEqual(meta.order, Meta.ORDER_DESC)
 
+    def test_order_locale(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order: locale\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertEqual(meta.order, Meta.ORDER_LOCALE)
+
+    def test_order_by_none(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertIsNone(meta.order_by)
+
+    def test_order_by_natural(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order_by: natural\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertEqual(meta.order_by, Meta.ORDER_BY_NATURAL)
+
+    def test_order_by_title(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order_by: title\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertEqual(meta.order_by, Meta.ORDER_BY_TITLE)
+
+    def test_order_by_mtime(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order_by: mtime\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertEqual(meta.order_by, Meta.ORDER_BY_MTIME)
+
+    def test_order_by_date(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order_by: date\n"
+
+        meta = Meta.load_from(".pages")
+        self.assertEqual(meta.order_by, Meta.ORDER_BY_DATE)
+
     def test_invalid_title_type(self, file_mock: FileMock):
         file_mock[".pages"].read_data = "title:\n" "  - Section Title\n"
 
@@ -141,6 +187,12 @@ class TestLoadFrom(TestCase):
         with self.assertRaises(TypeError):
             Meta.load_from(".pages")
 
+    def test_invalid_order_by(self, file_mock: FileMock):
+        file_mock[".pages"].read_data = "order_by: foo\n"
+
+        with self.assertRaises(TypeError):
+            Meta.load_from(".pages")
+
     def test_invalid_nav_type(self, file_mock: FileMock):
         file_mock[".pages"].read_data = "nav: 1.md\n"
 
@@ -203,3 +255,149 @@ class TestTryLoadFrom(TestCase):
     def test_none_path(self, file_mock: FileMock):
         meta = Meta.try_load_from(None)
         self.assertIsInstance(meta, Meta)
+
+
+class TestMetaNavRestItem(TestCase):
+    def test_glob(self):
+        item = MetaNavRestItem("... | intro*")
+        self.assertTrue(item.matches("introduction.md"))
+        self.assertFalse(item.matches("other.md"))
+        self.assertFalse(item.matches(None))
+
+    def test_glob_globstar(self):
+        item = MetaNavRestItem("... | glob=**/b*.md")
+        self.assertTrue(item.matches("a/c/b1.md"))
+        self.assertFalse(item.matches("a/c/a1.md"))
+
+    def test_regex(self):
+        item = MetaNavRestItem(r"... | regex=^\d+\.md$")
+        self.assertTrue(item.matches("10.md"))
+        self.assertFalse(item.matches("a10.md"))
+        self.assertFalse(item.matches(None))
+
+    def test_all(self):
+        item = MetaNavRestItem("...")
+        self.assertIsNone(item.regex)
+        self.assertTrue(item.matches("a.md"))
+        self.assertTrue(item.matches(None))
+
+    def test_compiled_once(self):
+        item = MetaNavRestItem("... | regex=a")
+        with mock.patch("re.compile") as compile_mock:
+            item.matches("a.md")
+            item.matches("b.md")
+        compile_mock.assert_not_called()
+
+    def test_invalid_regex(self):
+        with self.assertRaises(re.error):
+            MetaNavRestItem("... | regex=(")
+
+
+class TestRestItemList(TestCase):
+    def createList(self, *values: str) -> RestItemList:
+        rest_items = RestItemList()
+        for value in values:
+            rest_items.append(MetaNavRestItem(value))
+        return rest_items
+
+    def test_first_match_wins(self):
+        rest_items = self.createList("... | regex=md", "... | a*", "...")
+        self.assertEqual(rest_items.match("a.md"), MetaNavRestItem("... | regex=md"))
+        self.assertEqual(rest_items.match("a.txt"), MetaNavRestItem("... | a*"))
+
+    def test_regex_searches_whole_path(self):
+        rest_items = self.createList("... | b*", "... | regex=x$")
+        self.assertEqual(rest_items.match("abx"), MetaNavRestItem("... | regex=x$"))
+
+    def test_glob_must_match_whole_path(self):
+        rest_items = self.createList("... | a")
+        self.assertIsNone(rest_items.match("ab"))
+        self.assertIsNone(rest_items.match("a\n"))
+        self.assertEqual(rest_items.match("a"), MetaNavRestItem("... | a"))
+
+    def test_fallback_to_all(self):
+        rest_items = self.createList("...", "... | a*")
+        self.assertEqual(rest_items.match("b.md"), MetaNavRestItem("..."))
+        self.assertEqual(rest_items.match(None), MetaNavRestItem("..."))
+
+    def test_no_match(self):
+        rest_items = self.createList("... | a*")
+        self.assertIsNone(rest_items.match("b.md"))
+        self.assertIsNone(rest_items.match(None))
+
+    def test_pattern_with_groups(self):
+        rest_items = self.createList(r"... | regex=(a)\1", "... | b*")
+        self.assertEqual(rest_items.match("aa.md"), MetaNavRestItem(r"... | regex=(a)\1"))
+        self.assertEqual(rest_items.match("b.md"), MetaNavRestItem("... | b*"))
+        self.assertIsNone(rest_items.match("ab.md"))
+
+    def test_pattern_with_global_flags(self):
+        rest_items = self.createList("... | regex=(?i)^x", "... | b*")
+        self.assertEqual(rest_items.match("X.md"), MetaNavRestItem("... | regex=(?i)^x"))
+        self.assertEqual(rest_items.match("b.md"), MetaNavRestItem("... | b*"))
+        self.assertIsNone(rest_items.match("B.md"))
+        # older Python versions would apply the flag to all alternatives of a combined regex
+        self.assertIsNone(rest_items._combined_regex())
+
+    def test_consistent_with_matches(self):
+        values = ["... | regex=^\\d", "... | *.md", "... | glob=**/c*", "... | regex=(?i)^X", "..."]
+        rest_items = self.createList(*values)
+        for path in ["1.md", "a.md", "a/b/c.txt", "c", "x.txt", ".md", "a//b.md", "z"]:
+            expected = next(item for item in rest_items if item.matches(path))
+            self.assertEqual(rest_items.match(path), expected, path)
+
+    def test_append_after_match(self):
+        rest_items = self.createList("... | a*")
+        self.assertIsNone(rest_items.match("b.md"))
+        rest_items.append(MetaNavRestItem("... | b*"))
+        self.assertEqual(rest_items.match("b.md"), MetaNavRestItem("... | b*"))
+
+
+class TestEnvConditions(TestCase):
+    def setUp(self):
+        EnvConditions.reset()
+        self.addCleanup(EnvConditions.reset)
+
+        patcher = mock.patch.dict(os.environ, {"A": "", "D": "1"}, clear=True)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_single(self):
+        self.assertTrue(EnvConditions.evaluate("A"))
+        self.assertTrue(EnvConditions.evaluate("[A]"))
+        self.assertFalse(EnvConditions.evaluate("[B]"))
+
+    def test_operators(self):
+        self.assertTrue(EnvConditions.evaluate("[A] or [B]"))
+        self.assertTrue(EnvConditions.evaluate("[A] and [D]"))
+        self.assertFalse(EnvConditions.evaluate("[A] and [B]"))
+
+    def test_right_to_left(self):
+        self.assertTrue(EnvConditions.evaluate("A or B and C"))
+        self.assertFalse(EnvConditions.evaluate("B and C or A"))
+        self.assertFalse(EnvConditions.evaluate("B or A and C"))
+        self.assertTrue(EnvConditions.evaluate("A and B or A"))
+
+    def test_snapshot(self):
+        self.assertFalse(EnvConditions.evaluate("[B]"))
+        os.environ["B"] = "1"
+        self.assertFalse(EnvConditions.evaluate("[B]"))
+        self.assertFalse(EnvConditions.evaluate("[B] or [C]"))
+
+        EnvConditions.reset()
+        self.assertTrue(EnvConditions.evaluate("[B]"))
+
+    def test_compiled_once(self):
+        EnvConditions.compile.cache_clear()
+        EnvConditions.evaluate("[A] or [E]")
+        EnvConditions.reset()
+        EnvConditions.evaluate("[A] or [E]")
+        self.assertEqual(EnvConditions.compile.cache_info().misses, 1)
+
+    def test_nav_item_evaluated_lazily(self):
+        item = MetaNavItem.from_yaml("page.md | env=[B]", ".pages")
+        self.assertIsInstance(item, MetaNavEnvCondition)
+        self.assertEqual(item.value, "page.md")
+
+        os.environ["B"] = "1"
+        self.assertTrue(item.is_valid())
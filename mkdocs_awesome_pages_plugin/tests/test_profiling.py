@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, mock
+
+from ..profiling import Profiler
+
+
+class TestProfiler(TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        os.environ.pop(Profiler.ENV_VARIABLE, None)
+
+        self.profiler = Profiler()
+
+    def test_disabled(self):
+        self.profiler.configure(False)
+
+        with self.profiler.measure("phase"):
+            pass
+
+        self.assertFalse(self.profiler.enabled)
+        self.assertEqual(self.profiler.summary(), {})
+
+    def test_calls(self):
+        self.profiler.configure(True)
+
+        @self.profiler.timed("function")
+        def function(value):
+            return value * 2
+
+        self.assertEqual(function(2), 4)
+        self.assertEqual(function(3), 6)
+
+        self.assertEqual(self.profiler.summary()["function"]["calls"], 2)
+
+    def test_recursion_timed_once(self):
+        self.profiler.configure(True)
+
+        @self.profiler.timed("recursive")
+        def recursive(depth):
+            if depth:
+                recursive(depth - 1)
+
+        with mock.patch("time.perf_counter", side_effect=[0.0, 1.0, 2.0, 5.0, 6.0, 10.0]):
+            recursive(2)
+
+        self.assertEqual(self.profiler.summary()["recursive"], {"calls": 3, "seconds": 10.0})
+
+    def test_environment_variable(self):
+        os.environ[Profiler.ENV_VARIABLE] = "1"
+        self.profiler.configure(False)
+        self.assertTrue(self.profiler.enabled)
+        self.assertIsNone(self.profiler.output)
+
+        os.environ[Profiler.ENV_VARIABLE] = "0"
+        self.profiler.configure(False)
+        self.assertFalse(self.profiler.enabled)
+
+    def test_print_report(self):
+        self.profiler.configure(True)
+        with self.profiler.measure("phase"):
+            pass
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.profiler.report()
+
+        self.assertIn("phase", output.getvalue())
+
+    def test_json_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.profiler.configure("profile/report.json", directory)
+            with self.profiler.measure("phase"):
+                pass
+            self.profiler.report()
+
+            with open(os.path.join(directory, "profile", "report.json")) as file:
+                report = json.load(file)
+
+        self.assertEqual(report["phase"]["calls"], 1)
@@ -0,0 +1,75 @@
+import locale
+import os
+from unittest import TestCase, mock
+
+from ..sorting import collating, collation_key, natural_key
+
+
+class TestNaturalKey(TestCase):
+    def test_numbers(self):
+        self.assertEqual(
+            sorted(["page10", "page2", "page1", "page"], key=natural_key),
+            ["page", "page1", "page2", "page10"],
+        )
+
+    def test_versions(self):
+        self.assertEqual(
+            sorted(["v1.10.0", "v1.9.2", "v1.9.10", "v2.0.0"], key=natural_key),
+            ["v1.9.2", "v1.9.10", "v1.10.0", "v2.0.0"],
+        )
+
+    def test_case_insensitive(self):
+        self.assertEqual(sorted(["b", "A", "a"], key=natural_key), ["A", "a", "b"])
+
+    def test_leading_number(self):
+        self.assertEqual(sorted(["10-b", "a", "9-c"], key=natural_key), ["9-c", "10-b", "a"])
+
+    def test_empty(self):
+        self.assertEqual(sorted(["a", ""], key=natural_key), ["", "a"])
+
+    def test_collate(self):
+        with mock.patch("locale.strxfrm", side_effect=str.upper) as strxfrm:
+            natural_key.cache_clear()
+            self.assertEqual(natural_key("b2", collate=True), (("B", 2, ""), "b2"))
+            strxfrm.assert_any_call("b")
+        natural_key.cache_clear()
+
+
+class TestCollationKey(TestCase):
+    def test_cached(self):
+        collation_key.cache_clear()
+        with mock.patch("locale.strxfrm", side_effect=str.upper) as strxfrm:
+            self.assertEqual(collation_key("a"), "A")
+            self.assertEqual(collation_key("a"), "A")
+            strxfrm.assert_called_once_with("a")
+        collation_key.cache_clear()
+
+
+class TestCollating(TestCase):
+    def setUp(self):
+        self.previous = locale.setlocale(locale.LC_COLLATE)
+        patcher = mock.patch.dict(os.environ, {"LC_ALL": "C.UTF-8"})
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_restores_locale(self):
+        with collating():
+            current = locale.setlocale(locale.LC_COLLATE)
+            with collating():
+                self.assertEqual(locale.setlocale(locale.LC_COLLATE), current)
+            self.assertEqual(locale.setlocale(locale.LC_COLLATE), current)
+
+        if current == self.previous:
+            self.skipTest("C.UTF-8 locale not available")
+        self.assertEqual(locale.setlocale(locale.LC_COLLATE), self.previous)
+
+    def test_keys_restore_locale(self):
+        collation_key.cache_clear()
+        natural_key.cache_clear()
+        self.addCleanup(collation_key.cache_clear)
+        self.addCleanup(natural_key.cache_clear)
+
+        collation_key("a")
+        natural_key("a1", collate=True)
+
+        self.assertEqual(locale.setlocale(locale.LC_COLLATE), self.previous)
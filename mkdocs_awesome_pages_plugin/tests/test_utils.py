@@ -0,0 +1,158 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from ..utils import PathTrie, modification_times, remove_empty_directories, remove_files, walk_files
+
+
+def path(*components: str) -> str:
+    return os.path.join(os.sep, *components)
+
+
+class TestPathTrie(TestCase):
+    def test_add(self):
+        trie = PathTrie()
+        self.assertTrue(trie.add(path("site", "a")))
+        self.assertFalse(trie.add(path("site", "a")))
+        self.assertFalse(trie.add(path("site", "a", "")))
+        self.assertEqual(list(trie), [path("site", "a")])
+        self.assertEqual(len(trie), 1)
+
+    def test_contains(self):
+        trie = PathTrie([path("site", "a")])
+        self.assertIn(path("site", "a"), trie)
+        self.assertNotIn(path("site"), trie)
+        self.assertNotIn(path("site", "a", "b"), trie)
+
+    def test_covers(self):
+        trie = PathTrie([path("site", "a"), path("site", "c", "d")])
+        self.assertTrue(trie.covers(path("site", "a")))
+        self.assertTrue(trie.covers(path("site", "a", "b", "index.html")))
+        self.assertTrue(trie.covers(path("site", "c", "d", "e.png")))
+        self.assertFalse(trie.covers(path("site", "c", "e.png")))
+        self.assertFalse(trie.covers(path("site")))
+
+    def test_covers_whole_components_only(self):
+        trie = PathTrie([path("site", "a")])
+        self.assertFalse(trie.covers(path("site", "ab", "index.html")))
+
+    def test_roots(self):
+        trie = PathTrie([path("site", "a", "b"), path("site", "a"), path("site", "c"), path("site", "a", "d")])
+        self.assertEqual(trie.roots(), [path("site", "a"), path("site", "c")])
+
+    def test_empty(self):
+        trie = PathTrie()
+        self.assertFalse(trie)
+        self.assertFalse(trie.covers(path("site")))
+        self.assertEqual(trie.roots(), [])
+
+
+class TestWalkFiles(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.root = temp_directory.name
+
+        for relative_path in ["a.png", "sub/b.png", "sub/deep/c.png", "assets/d.js", "other/e.png"]:
+            self.create(relative_path)
+
+    def create(self, relative_path: str):
+        full_path = self.path(relative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w") as file:
+            file.write(relative_path)
+
+    def path(self, relative_path: str) -> str:
+        return os.path.join(self.root, *relative_path.split("/"))
+
+    def test_all_files(self):
+        self.assertEqual(
+            sorted(walk_files([self.root], set())),
+            sorted(self.path(p) for p in ["a.png", "sub/b.png", "sub/deep/c.png", "assets/d.js", "other/e.png"]),
+        )
+
+    def test_ignored_directory_not_entered(self):
+        scanned = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            scanned.append(path)
+            return original_scandir(path)
+
+        ignored = {self.path("assets"), self.path("sub/b.png")}
+        with mock.patch("os.scandir", side_effect=scandir):
+            files = sorted(walk_files([self.root], ignored))
+
+        self.assertEqual(files, sorted(self.path(p) for p in ["a.png", "sub/deep/c.png", "other/e.png"]))
+        self.assertNotIn(self.path("assets"), scanned)
+
+    def test_ignored_root(self):
+        self.assertEqual(list(walk_files([self.path("sub")], {self.path("sub")})), [])
+
+    def test_missing_root(self):
+        self.assertEqual(list(walk_files([self.path("missing")], set())), [])
+
+
+class TestModificationTimes(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.root = temp_directory.name
+
+    def test(self):
+        os.makedirs(os.path.join(self.root, "sub"))
+        with open(os.path.join(self.root, "a.md"), "w"):
+            pass
+        os.utime(os.path.join(self.root, "a.md"), ns=(100, 200))
+        os.utime(os.path.join(self.root, "sub"), ns=(300, 400))
+
+        self.assertEqual(modification_times(self.root), {"a.md": 200, "sub": 400})
+
+    def test_missing_directory(self):
+        self.assertEqual(modification_times(os.path.join(self.root, "missing")), {})
+
+
+class TestRemoveFiles(TestCase):
+    def setUp(self):
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.root = temp_directory.name
+
+        for relative_path in ["a.png", "keep.png", "sub/b.png", "sub/deep/c.png", "sub/deep/deeper/d.png"]:
+            full_path = self.path(relative_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as file:
+                file.write(relative_path)
+
+    def path(self, relative_path: str) -> str:
+        return os.path.join(self.root, *relative_path.split("/"))
+
+    def test_removes_files_and_empty_directories(self):
+        remove_files(
+            [self.path(p) for p in ["a.png", "sub/b.png", "sub/deep/c.png", "sub/deep/deeper/d.png"]], self.root
+        )
+
+        self.assertEqual(os.listdir(self.root), ["keep.png"])
+
+    def test_keeps_non_empty_directories(self):
+        remove_files([self.path("sub/deep/c.png"), self.path("sub/deep/deeper/d.png")], self.root)
+
+        self.assertFalse(os.path.exists(self.path("sub/deep")))
+        self.assertTrue(os.path.exists(self.path("sub/b.png")))
+
+    def test_keeps_root(self):
+        sub = self.path("sub")
+        remove_files([self.path("sub/b.png"), self.path("sub/deep/c.png"), self.path("sub/deep/deeper/d.png")], sub)
+
+        self.assertTrue(os.path.isdir(sub))
+        self.assertEqual(os.listdir(sub), [])
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            remove_files([self.path("missing.png")], self.root)
+
+    def test_remove_empty_directories_outside_root(self):
+        os.makedirs(self.path("empty"))
+        remove_empty_directories([self.path("empty")], self.path("sub"))
+
+        self.assertTrue(os.path.isdir(self.path("empty")))
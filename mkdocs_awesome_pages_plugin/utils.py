@@ -1,5 +1,7 @@
+import heapq
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional
 
 
 class cd:
@@ -38,3 +40,152 @@ def join_paths(path1: Optional[str], path2: Optional[str]) -> Optional[str]:
     """Joins two paths if neither of them is None"""
     if path1 is not None and path2 is not None:
         return os.path.join(path1, path2)
+
+
+def walk_files(roots: Iterable[str], ignored: AbstractSet[str]) -> Iterator[str]:
+    """Yields the paths of all files inside the given directories, following symbolic links
+
+    Ignored paths are pruned: ignored directories are never entered. Paths are compared after joining the entry names
+    to the given roots, so both should be normalized.
+    """
+    stack = [root for root in reversed(list(roots)) if root not in ignored]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            directories = []
+            for entry in entries:
+                if entry.path in ignored:
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    directories.append(entry.path)
+                else:
+                    yield entry.path
+        stack.extend(reversed(directories))
+
+
+def modification_times(directory: str) -> Dict[str, int]:
+    """Returns the modification times in nanoseconds of the entries of a directory, by name, with a single scandir pass
+
+    Symbolic links are followed, entries that cannot be stat'ed are left out. Returns an empty dict if the directory
+    cannot be read.
+    """
+    times = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    times[entry.name] = entry.stat().st_mtime_ns
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return times
+
+
+def remove_files(paths: Iterable[str], root: str):
+    """Removes the files using a thread pool, then removes the directories left empty inside root"""
+    paths = list(paths)
+    with ThreadPoolExecutor() as executor:
+        # consume the results to propagate errors
+        for _ in executor.map(os.remove, paths):
+            pass
+
+    remove_empty_directories({os.path.dirname(path) for path in paths}, root)
+
+
+def remove_empty_directories(directories: Iterable[str], root: str):
+    """Removes the given directories if they are empty, continuing with their parents
+
+    Directories are processed bottom-up, so every directory is checked once. Neither root nor any directory outside
+    of it is removed.
+    """
+    root = os.path.normpath(root)
+    pending = {os.path.normpath(directory) for directory in directories}
+    heap = [(-directory.count(os.sep), directory) for directory in pending]
+    heapq.heapify(heap)
+
+    while heap:
+        _, directory = heapq.heappop(heap)
+        if not directory.startswith(root + os.sep):
+            continue
+        try:
+            os.rmdir(directory)
+        except OSError:
+            # not empty
+            continue
+
+        parent = os.path.dirname(directory)
+        if parent not in pending:
+            pending.add(parent)
+            heapq.heappush(heap, (-parent.count(os.sep), parent))
+
+
+class PathTrie:
+    """Set of directory paths, stored as a trie of their path components
+
+    Checking whether a path lies inside any of the stored directories costs O(path depth), regardless of how many
+    directories are stored.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._root = {}
+        self._paths = []
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: str) -> bool:
+        """Adds the path and returns whether it wasn't stored yet"""
+        node = self._root
+        for component in self._components(path):
+            node = node.setdefault(component, {})
+        if None in node:
+            return False
+        node[None] = path
+        self._paths.append(path)
+        return True
+
+    def covers(self, path: str) -> bool:
+        """Returns whether the path is one of the stored directories or lies inside one of them"""
+        node = self._root
+        for component in self._components(path):
+            node = node.get(component)
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+    def roots(self) -> List[str]:
+        """Returns the stored directories that don't lie inside another stored directory"""
+        roots = []
+        for path in self._paths:
+            path = os.path.normpath(path)
+            parent = os.path.dirname(path)
+            if parent == path or not self.covers(parent):
+                roots.append(path)
+        return roots
+
+    def __contains__(self, path: str) -> bool:
+        node = self._root
+        for component in self._components(path):
+            node = node.get(component)
+            if node is None:
+                return False
+        return None in node
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @staticmethod
+    def _components(path: str) -> List[str]:
+        return os.path.normpath(path).split(os.sep)